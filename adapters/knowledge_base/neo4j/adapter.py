@@ -22,27 +22,40 @@ from .operations import (
 class Neo4jAdapter(BaseKBAdapter):
     """Neo4j adapter for Knowledge Base operations."""
 
-    def __init__(self, config_path: str, nats_client=None, kb_id: str | None = None):
+    def __init__(
+        self,
+        config_path: str,
+        nats_client=None,
+        kb_id: str | None = None,
+        driver: AsyncDriver | None = None,
+    ):
         """Initialize Neo4j adapter.
 
         Args:
             config_path: Path to the configuration file
             nats_client: Optional NATS client for message broker pattern
             kb_id: Optional KB identifier for NATS subject routing
+            driver: Optional shared driver; its connection pool is reused and
+                left open on disconnect
         """
-        self.driver: AsyncDriver | None = None
+        self.driver: AsyncDriver | None = driver
+        self._owns_driver = driver is None
         super().__init__(config_path, nats_client, kb_id)
 
     async def connect(self):
         """Establish connection to Neo4j."""
+        if self.driver is not None:
+            return
         uri = f"bolt://{self.config['host']}:{self.config['port']}"
         self.driver = AsyncGraphDatabase.driver(
-            uri, auth=basic_auth(self.config["user"], self.config["password"])
+            uri,
+            auth=basic_auth(self.config["user"], self.config["password"]),
+            max_connection_pool_size=self.config.get("pool_max_size", 100),
         )
 
     async def disconnect(self):
         """Close connection to Neo4j."""
-        if self.driver:
+        if self.driver and self._owns_driver:
             await self.driver.close()
 
     async def health(self) -> HealthResponse:
@@ -9,12 +9,16 @@ import asyncpg
 from ..base import BaseKBAdapter
 from ..schemas import HealthResponse, HealthStatus, OperationMetadata
 from .operations import (
+    CopyInput,
+    CopyOutput,
     DeleteInput,
     DeleteOutput,
     InsertInput,
     InsertOutput,
     SQLQueryInput,
     SQLQueryOutput,
+    SQLScriptInput,
+    SQLScriptOutput,
     UpdateInput,
     UpdateOutput,
 )
@@ -23,19 +27,29 @@ from .operations import (
 class PostgresAdapter(BaseKBAdapter):
     """PostgreSQL adapter for Knowledge Base operations."""
 
-    def __init__(self, config_path: str, nats_client=None, kb_id: str | None = None):
+    def __init__(
+        self,
+        config_path: str,
+        nats_client=None,
+        kb_id: str | None = None,
+        pool: asyncpg.Pool | None = None,
+    ):
         """Initialize PostgreSQL adapter.
 
         Args:
             config_path: Path to the configuration file
             nats_client: Optional NATS client for message broker pattern
             kb_id: Optional KB identifier for NATS subject routing
+            pool: Optional shared connection pool; left open on disconnect
         """
-        self.pool: asyncpg.Pool | None = None
+        self.pool: asyncpg.Pool | None = pool
+        self._owns_pool = pool is None
         super().__init__(config_path, nats_client, kb_id)
 
     async def connect(self):
         """Establish connection pool to PostgreSQL."""
+        if self.pool is not None:
+            return
         self.pool = await asyncpg.create_pool(
             host=self.config["host"],
             port=self.config["port"],
@@ -48,7 +62,7 @@ class PostgresAdapter(BaseKBAdapter):
 
     async def disconnect(self):
         """Close connection pool to PostgreSQL."""
-        if self.pool:
+        if self.pool and self._owns_pool:
             await self.pool.close()
 
     async def health(self) -> HealthResponse:
@@ -72,6 +86,32 @@ class PostgresAdapter(BaseKBAdapter):
         except Exception as e:
             return HealthResponse(status=HealthStatus.UNHEALTHY, message=str(e))
 
+    async def _direct_execute(self, sql: str) -> str:
+        """Run SQL straight on the pool, bypassing the operation registry and NATS.
+
+        Intended for setup work such as seeding fixtures. A multi-statement
+        script without arguments runs in a single implicit transaction.
+
+        Args:
+            sql: SQL statement(s) to execute
+
+        Returns:
+            Status of the last statement executed
+        """
+        return await self.pool.execute(sql)  # type: ignore[union-attr]
+
+    async def execute_many(self, query: str, rows: list[tuple[Any, ...]]) -> None:
+        """Run a parameterised statement once per row in a single round-trip.
+
+        The statement is prepared once and reused for every row.
+
+        Args:
+            query: SQL statement with positional placeholders ($1, $2, ...)
+            rows: Argument tuples, one per execution
+        """
+        async with self.pool.acquire() as conn:  # type: ignore[union-attr]
+            await conn.executemany(query, rows)
+
     def _register_operations(self):
         """Register PostgreSQL-specific operations."""
 
@@ -86,7 +126,29 @@ class PostgresAdapter(BaseKBAdapter):
             handler=self._sql_query,
         )
 
-        # Operation 2: Insert
+        # Operation 2: SQL Script
+        self.operation_registry.register(
+            OperationMetadata(
+                name="sql_script",
+                description="Execute a multi-statement SQL script in one transaction",
+                input_schema=SQLScriptInput.model_json_schema(),
+                output_schema=SQLScriptOutput.model_json_schema(),
+            ),
+            handler=self._sql_script,
+        )
+
+        # Operation 3: Bulk copy
+        self.operation_registry.register(
+            OperationMetadata(
+                name="copy",
+                description="Bulk load rows into table using COPY",
+                input_schema=CopyInput.model_json_schema(),
+                output_schema=CopyOutput.model_json_schema(),
+            ),
+            handler=self._copy,
+        )
+
+        # Operation 4: Insert
         self.operation_registry.register(
             OperationMetadata(
                 name="insert",
@@ -97,7 +159,7 @@ class PostgresAdapter(BaseKBAdapter):
             handler=self._insert,
         )
 
-        # Operation 3: Update
+        # Operation 5: Update
         self.operation_registry.register(
             OperationMetadata(
                 name="update",
@@ -108,7 +170,7 @@ class PostgresAdapter(BaseKBAdapter):
             handler=self._update,
         )
 
-        # Operation 4: Delete
+        # Operation 6: Delete
         self.operation_registry.register(
             OperationMetadata(
                 name="delete",
@@ -162,6 +224,39 @@ class PostgresAdapter(BaseKBAdapter):
             serialized_rows = [self._serialize_row(dict(row)) for row in rows]
             return SQLQueryOutput(rows=serialized_rows, row_count=len(rows))
 
+    async def _sql_script(self, script: str) -> SQLScriptOutput:
+        """Execute a semicolon-separated SQL script in a single transaction.
+
+        Args:
+            script: SQL statements separated by semicolons
+
+        Returns:
+            Status of the last statement in the script
+        """
+        async with self.pool.acquire() as conn:  # type: ignore[union-attr]
+            async with conn.transaction():
+                status = await conn.execute(script)
+            return SQLScriptOutput(status=status, success=True)
+
+    async def _copy(
+        self, table: str, columns: list[str], rows: list[list[Any]]
+    ) -> CopyOutput:
+        """Bulk load rows into a table with COPY FROM STDIN.
+
+        Args:
+            table: Table name
+            columns: Column names, in the order values appear in each row
+            rows: Row values
+
+        Returns:
+            Number of rows copied
+        """
+        async with self.pool.acquire() as conn:  # type: ignore[union-attr]
+            status = await conn.copy_records_to_table(
+                table, records=rows, columns=columns
+            )
+            return CopyOutput(copied_count=int(status.split()[-1]), success=True)
+
     async def _insert(self, table: str, data: dict[str, Any]) -> InsertOutput:
         """Insert data into a table.
 
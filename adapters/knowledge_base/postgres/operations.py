@@ -14,6 +14,20 @@ class SQLQueryInput(BaseModel):
     params: dict[str, Any] | None = None
 
 
+class SQLScriptInput(BaseModel):
+    """Input schema for SQL script operation."""
+
+    script: str
+
+
+class CopyInput(BaseModel):
+    """Input schema for bulk copy operation."""
+
+    table: str
+    columns: list[str]
+    rows: list[list[Any]]
+
+
 class InsertInput(BaseModel):
     """Input schema for insert operation."""
 
@@ -46,6 +60,20 @@ class SQLQueryOutput(BaseModel):
     row_count: int
 
 
+class SQLScriptOutput(BaseModel):
+    """Output schema for SQL script operation."""
+
+    status: str
+    success: bool
+
+
+class CopyOutput(BaseModel):
+    """Output schema for bulk copy operation."""
+
+    copied_count: int
+    success: bool
+
+
 class InsertOutput(BaseModel):
     """Output schema for insert operation."""
 
@@ -3,7 +3,8 @@
 import asyncio
 import json
 import logging
-from collections.abc import Callable, Coroutine
+from collections.abc import AsyncIterator, Callable, Coroutine
+from contextlib import asynccontextmanager, suppress
 from typing import Any
 
 import nats
@@ -62,6 +63,51 @@ class NATSWrapper:
         except Exception as e:
             logger.error(f"Failed to publish to {subject}: {e}")
 
+    async def publish_async(self, subject: str, data: dict[str, Any]) -> None:
+        """Queue a message on the client's outbound buffer without flushing.
+
+        Unlike ``publish`` this skips per-message debug formatting; callers that
+        need delivery guarantees should call ``flush`` once after a batch.
+
+        Args:
+            subject: NATS subject to publish to
+            data: Data dictionary to publish (will be JSON encoded)
+        """
+        if not self.nc:
+            logger.error("Not connected to NATS")
+            return
+
+        try:
+            await self.nc.publish(subject, json.dumps(data).encode())
+        except Exception as e:
+            logger.error(f"Failed to publish to {subject}: {e}")
+
+    async def flush(self, timeout: float = 2.0) -> None:
+        """Drain pending outbound messages and wait for the server round trip.
+
+        Args:
+            timeout: Maximum time in seconds to wait for the flush
+        """
+        if not self.nc:
+            logger.error("Not connected to NATS")
+            return
+
+        await self.nc.flush(timeout=timeout)
+
+    @asynccontextmanager
+    async def batch(self, timeout: float = 2.0) -> AsyncIterator[None]:
+        """Group the publishes made inside the block behind a single flush.
+
+        The client already buffers outbound messages, so publishes inside the
+        block are coalesced into as few writes as possible; on exit one flush
+        round trip confirms the server has received all of them.
+
+        Args:
+            timeout: Maximum time in seconds to wait for the closing flush
+        """
+        yield
+        await self.flush(timeout=timeout)
+
     async def subscribe(
         self,
         subject: str,
@@ -113,6 +159,21 @@ class NATSWrapper:
         except Exception as e:
             logger.error(f"Failed to subscribe to {subject}: {e}")
 
+    async def prewarm_request_inbox(self) -> None:
+        """Set up the shared reply inbox before the first real request.
+
+        nats-py creates its wildcard reply-inbox subscription lazily on the
+        first request. Sending one throwaway request to a subject nobody
+        serves creates it through the public API; the expected no-responders
+        (or timeout) error is ignored.
+        """
+        if not self.nc:
+            logger.error("Not connected to NATS")
+            return
+
+        with suppress(nats.errors.NoRespondersError, nats.errors.TimeoutError):
+            await self.nc.request("_MESH.prewarm", b"", timeout=0.5)
+
     async def request(
         self, subject: str, data: dict[str, Any], timeout: int | None = None
     ) -> dict[str, Any] | None:
@@ -5,6 +5,7 @@ This package provides adapters for persisting mesh state (agent registry,
 KB registry, policies, audit logs) to various storage backends.
 """
 
+from .audit_buffer import AuditBuffer
 from .base import BasePersistenceAdapter
 from .schemas import (
     AgentRecord,
@@ -30,6 +31,7 @@ from .schemas import (
 )
 
 __all__ = [
+    "AuditBuffer",
     "BasePersistenceAdapter",
     "HealthStatus",
     "AuditEventType",
@@ -0,0 +1,86 @@
+"""
+Buffered audit logging.
+
+Collects audit events in memory and writes them in batches through the
+persistence adapter, so many small writes become one transaction.
+"""
+import asyncio
+import logging
+
+from .base import BasePersistenceAdapter
+from .schemas import AuditEvent
+
+logger = logging.getLogger(__name__)
+
+
+class AuditBuffer:
+    """Queue audit events and flush them to persistence in batches"""
+
+    def __init__(self, persistence: BasePersistenceAdapter, max_batch: int = 100):
+        """Initialize buffer.
+
+        Args:
+            persistence: Adapter the batches are written to
+            max_batch: Maximum number of events written in one transaction
+        """
+        self.persistence = persistence
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue[AuditEvent] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Start the background flusher"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Write any pending events and stop the background flusher"""
+        if self._task is None:
+            return
+        await self.flush()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def append(self, event: AuditEvent) -> None:
+        """Queue an event for the next batch"""
+        await self._queue.put(event)
+
+    async def flush(self) -> None:
+        """Wait until every queued event has been written.
+
+        If the flusher is not running (never started, or it died), nothing
+        would drain the queue, so the pending events are written here.
+        """
+        if self._task is None or self._task.done():
+            while not self._queue.empty():
+                batch = []
+                while len(batch) < self.max_batch and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                await self._write(batch)
+            return
+        await self._queue.join()
+
+    async def _run(self) -> None:
+        """Coalesce queued events into batches and write each in one call"""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            await self._write(batch)
+
+    async def _write(self, batch: list[AuditEvent]) -> None:
+        """Write one batch and mark its events done, logging failures"""
+        try:
+            await self.persistence.write_audit_logs_bulk(batch)
+        except Exception as e:
+            logger.error(f"Failed to write {len(batch)} audit events: {e}")
+        finally:
+            for _ in batch:
+                self._queue.task_done()
@@ -4,6 +4,7 @@ Base persistence adapter interface.
 Mesh uses this interface; adapters implement storage logic.
 """
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from typing import Any
 
 from .schemas import (
@@ -72,6 +73,14 @@ class BasePersistenceAdapter(ABC):
         """Get agent by identity"""
         pass
 
+    async def get_agents(self, identities: list[str]) -> list[AgentRecord]:
+        """
+        Get several agents by identity; identities not registered are skipped.
+        Adapters should override this to fetch in one query.
+        """
+        agents = [await self.get_agent(identity) for identity in identities]
+        return [agent for agent in agents if agent is not None]
+
     @abstractmethod
     async def update_agent_status(self, identity: str, status: str) -> None:
         """Update agent health status"""
@@ -129,6 +138,17 @@ class BasePersistenceAdapter(ABC):
         """Remove KB from registry"""
         pass
 
+    async def deregister_many(self, identities: list[str], kb_ids: list[str]) -> None:
+        """
+        Remove several agents and KBs; ids that are not registered are skipped.
+        Adapters should override this to delete in one transaction; the
+        default deregisters entries one by one.
+        """
+        for identity in identities:
+            await self.deregister_agent(identity)
+        for kb_id in kb_ids:
+            await self.deregister_kb(kb_id)
+
     # ============================================
     # POLICY STORE
     # ============================================
@@ -181,11 +201,29 @@ class BasePersistenceAdapter(ABC):
         """
         pass
 
+    async def write_audit_logs_bulk(self, events: list[AuditEvent]) -> list[str]:
+        """
+        Log several audit events at once.
+        Adapters should override this to write the batch in one transaction;
+        the default logs events one by one.
+        Returns: event record IDs, in input order
+        """
+        return [await self.log_event(event) for event in events]
+
     @abstractmethod
     async def query_audit_logs(self, query: AuditQuery) -> list[AuditRecord]:
         """Query audit logs"""
         pass
 
+    async def iter_audit_logs(self, query: AuditQuery) -> AsyncIterator[AuditRecord]:
+        """
+        Stream audit logs matching a query.
+        Adapters should override this to yield rows as they are read; the
+        default yields from query_audit_logs.
+        """
+        for record in await self.query_audit_logs(query):
+            yield record
+
     @abstractmethod
     async def get_audit_stats(self, source_id: str | None = None) -> dict:
         """Get audit statistics (count by outcome, event type, etc.)"""
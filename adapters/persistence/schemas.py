@@ -209,6 +209,7 @@ class AuditQuery(BaseModel):
 
     event_type: AuditEventType | None = None
     source_id: str | None = None
+    source_ids: list[str] | None = None  # Match any of these sources
     target_id: str | None = None
     outcome: AuditOutcome | None = None
     start_time: datetime | None = None
@@ -3,9 +3,12 @@ SQLite persistence adapter implementation.
 
 Handles schema translation and migrations internally.
 """
+import asyncio
 import json
+import logging
 import uuid
-from datetime import UTC, datetime
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -24,6 +27,8 @@ from ..schemas import (
     AgentRecord,
     AgentRegistration,
     AuditEvent,
+    AuditEventType,
+    AuditOutcome,
     AuditQuery,
     AuditRecord,
     HealthStatus,
@@ -36,6 +41,16 @@ from ..schemas import (
 )
 from .migrations import run_migrations
 
+logger = logging.getLogger(__name__)
+
+_AUDIT_INSERT_SQL = """
+    INSERT INTO audit_logs (
+        id, event_type, source_id, target_id, outcome, timestamp,
+        request_metadata, policy_decision, masked_fields,
+        full_request, full_response, provenance_chain
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class SQLitePersistenceAdapter(BasePersistenceAdapter):
     """SQLite implementation of persistence adapter"""
@@ -44,6 +59,11 @@ class SQLitePersistenceAdapter(BasePersistenceAdapter):
         super().__init__(config_path)
         self.db_path: Path | None = None
         self.conn: aiosqlite.Connection | None = None
+        # Serialises write transactions on the shared connection so that one
+        # coroutine's commit cannot flush another's half-finished statement
+        self._write_lock = asyncio.Lock()
+        # Unbounded audit queries are routine for some callers; warn once
+        self._warned_unbounded_audit_query = False
 
     async def connect(self) -> None:
         """Connect to SQLite and run migrations"""
@@ -55,11 +75,21 @@ class SQLitePersistenceAdapter(BasePersistenceAdapter):
             assert self.config is not None, "Config is None after loading"
             assert "database" in self.config, "Config missing database section"
 
-            self.db_path = Path(self.config["database"]["path"])
-            self.db_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Connect
-            self.conn = await aiosqlite.connect(str(self.db_path))
+            # A "file:" path is an SQLite URI, e.g. a shared-cache in-memory
+            # database: file:name?mode=memory&cache=shared
+            database_path = self.config["database"]["path"]
+            is_uri = database_path.startswith("file:")
+            self.db_path = Path(database_path)
+            if not is_uri:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Connect; sqlite3 reuses compiled statements keyed by SQL text, so
+            # the cache must hold every distinct query shape the adapter issues
+            self.conn = await aiosqlite.connect(
+                database_path,
+                uri=is_uri,
+                cached_statements=self.config["database"].get("cached_statements", 128),
+            )
             self.conn.row_factory = aiosqlite.Row
 
             # Set SQLite pragmas
@@ -67,11 +97,28 @@ class SQLitePersistenceAdapter(BasePersistenceAdapter):
                 f"PRAGMA journal_mode={self.config['database'].get('journal_mode', 'WAL')}"
             )
             await self.conn.execute(
-                f"PRAGMA synchronous={self.config['database'].get('synchronous', 'NORMAL')}"
+                f"PRAGMA wal_autocheckpoint={self.config['database'].get('wal_autocheckpoint', 1000)}"
+            )
+            await self.conn.execute(
+                f"PRAGMA temp_store={self.config['database'].get('temp_store', 'DEFAULT')}"
+            )
+            await self.conn.execute(
+                f"PRAGMA busy_timeout={self.config['database'].get('busy_timeout', 5000)}"
+            )
+            await self.conn.execute(
+                f"PRAGMA cache_size={self.config['database'].get('cache_size', -2000)}"
+            )
+            await self.conn.execute(
+                f"PRAGMA mmap_size={self.config['database'].get('mmap_size', 0)}"
             )
 
-            # Run migrations (adapter handles schema setup)
+            # Run migrations (adapter handles schema setup) with full syncs so
+            # schema changes are durable, then relax to the configured level
+            await self.conn.execute("PRAGMA synchronous=FULL")
             await run_migrations(self.conn)
+            await self.conn.execute(
+                f"PRAGMA synchronous={self.config['database'].get('synchronous', 'NORMAL')}"
+            )
 
         except Exception as e:
             raise PersistenceConnectionError(f"Failed to connect to SQLite: {e}") from e
@@ -103,27 +150,28 @@ class SQLitePersistenceAdapter(BasePersistenceAdapter):
         now = datetime.now(UTC).isoformat()
 
         try:
-            await self.conn.execute(
-                """
-                INSERT INTO agents (
-                    id, identity, version, capabilities, operations,
-                    schemas, health_endpoint, status, registered_at, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    agent_id,
-                    agent.identity,
-                    agent.version,
-                    json.dumps(agent.capabilities),  # List → JSON
-                    json.dumps(agent.operations),
-                    json.dumps(agent.schemas),  # Dict → JSON
-                    agent.health_endpoint,
-                    HealthStatus.OFFLINE.value,
-                    now,
-                    json.dumps(agent.metadata),
-                ),
-            )
-            await self.conn.commit()
+            async with self._write_lock:
+                await self.conn.execute(
+                    """
+                    INSERT INTO agents (
+                        id, identity, version, capabilities, operations,
+                        schemas, health_endpoint, status, registered_at, metadata
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        agent_id,
+                        agent.identity,
+                        agent.version,
+                        json.dumps(agent.capabilities),  # List → JSON
+                        json.dumps(agent.operations),
+                        json.dumps(agent.schemas),  # Dict → JSON
+                        agent.health_endpoint,
+                        HealthStatus.OFFLINE.value,
+                        now,
+                        json.dumps(agent.metadata),
+                    ),
+                )
+                await self.conn.commit()
             return agent_id
         except aiosqlite.IntegrityError as e:
             raise DuplicateRecordError(
@@ -144,38 +192,58 @@ class SQLitePersistenceAdapter(BasePersistenceAdapter):
             if not row:
                 return None
 
-            return AgentRecord(
-                id=row["id"],
-                identity=row["identity"],
-                version=row["version"],
-                capabilities=json.loads(row["capabilities"]),  # JSON → List
-                operations=json.loads(row["operations"]),
-                schemas=json.loads(row["schemas"]),  # JSON → Dict
-                health_endpoint=row["health_endpoint"],
-                status=HealthStatus(row["status"]),
-                registered_at=datetime.fromisoformat(row["registered_at"]),
-                last_heartbeat=datetime.fromisoformat(row["last_heartbeat"])
-                if row["last_heartbeat"]
-                else None,
-                metadata=json.loads(row["metadata"]),
-            )
+            return self._row_to_agent_record(row)
         except Exception as e:
             raise QueryError(f"Failed to get agent: {e}") from e
 
+    async def get_agents(self, identities: list[str]) -> list[AgentRecord]:
+        """Get several agents by identity in one query; unknown ids are skipped"""
+        assert self.conn is not None, "Adapter not connected"
+        if not identities:
+            return []
+        try:
+            placeholders = ", ".join("?" * len(identities))
+            cursor = await self.conn.execute(
+                f"SELECT * FROM agents WHERE identity IN ({placeholders})", identities
+            )
+            rows = await cursor.fetchall()
+            return [self._row_to_agent_record(row) for row in rows]
+        except Exception as e:
+            raise QueryError(f"Failed to get agents: {e}") from e
+
+    def _row_to_agent_record(self, row: aiosqlite.Row) -> AgentRecord:
+        """Convert an agents row to an AgentRecord"""
+        return AgentRecord(
+            id=row["id"],
+            identity=row["identity"],
+            version=row["version"],
+            capabilities=json.loads(row["capabilities"]),  # JSON → List
+            operations=json.loads(row["operations"]),
+            schemas=json.loads(row["schemas"]),  # JSON → Dict
+            health_endpoint=row["health_endpoint"],
+            status=HealthStatus(row["status"]),
+            registered_at=datetime.fromisoformat(row["registered_at"]),
+            last_heartbeat=datetime.fromisoformat(row["last_heartbeat"])
+            if row["last_heartbeat"]
+            else None,
+            metadata=json.loads(row["metadata"]),
+        )
+
     async def update_agent_status(self, identity: str, status: str) -> None:
         """Update agent status"""
         assert self.conn is not None, "Adapter not connected"
         now = datetime.now(UTC).isoformat()
         try:
-            await self.conn.execute(
-                """
-                UPDATE agents
-                SET status = ?, last_heartbeat = ?
-                WHERE identity = ?
-                """,
-                (status, now, identity),
-            )
-            await self.conn.commit()
+            async with self._write_lock:
+                await self.conn.execute(
+                    """
+                    UPDATE agents
+                    SET status = ?, last_heartbeat = ?
+                    WHERE identity = ?
+                    """,
+                    (status, now, identity),
+                )
+                await self.conn.commit()
         except Exception as e:
             raise QueryError(f"Failed to update agent status: {e}") from e
 
@@ -184,15 +252,16 @@ class SQLitePersistenceAdapter(BasePersistenceAdapter):
         assert self.conn is not None, "Adapter not connected"
         try:
             capabilities_json = json.dumps(capabilities)
-            await self.conn.execute(
-                """
-                UPDATE agents
-                SET capabilities = ?
-                WHERE identity = ?
-                """,
-                (capabilities_json, identity),
-            )
-            await self.conn.commit()
+            async with self._write_lock:
+                await self.conn.execute(
+                    """
+                    UPDATE agents
+                    SET capabilities = ?
+                    WHERE identity = ?
+                    """,
+                    (capabilities_json, identity),
+                )
+                await self.conn.commit()
         except Exception as e:
             raise QueryError(f"Failed to update agent capabilities: {e}") from e
 
@@ -212,15 +281,20 @@ class SQLitePersistenceAdapter(BasePersistenceAdapter):
                 params.append(query.status.value)
 
             if query.capabilities:
-                # SQLite JSON query - use json_each for proper array membership check
-                for cap in query.capabilities:
-                    conditions.append(
-                        """EXISTS (
-                            SELECT 1 FROM json_each(capabilities) 
-                            WHERE json_each.value = ?
-                        )"""
-                    )
-                    params.append(cap)
+                # Agent must have every requested capability; seek each one
+                # in agent_capabilities and keep agents that matched them all
+                capabilities = list(dict.fromkeys(query.capabilities))
+                placeholders = ", ".join("?" * len(capabilities))
+                conditions.append(
+                    f"""identity IN (
+                        SELECT identity FROM agent_capabilities
+                        WHERE capability IN ({placeholders})
+                        GROUP BY identity
+                        HAVING COUNT(*) = ?
+                    )"""
+                )
+                params.extend(capabilities)
+                params.append(len(capabilities))
 
             where_clause = " AND ".join(conditions) if conditions else "1=1"
             sql = f"SELECT * FROM agents WHERE {where_clause} LIMIT ?"
@@ -229,24 +303,7 @@ class SQLitePersistenceAdapter(BasePersistenceAdapter):
             cursor = await self.conn.execute(sql, params)
             rows = await cursor.fetchall()
 
-            return [
-                AgentRecord(
-                    id=row["id"],
-                    identity=row["identity"],
-                    version=row["version"],
-                    capabilities=json.loads(row["capabilities"]),
-                    operations=json.loads(row["operations"]),
-                    schemas=json.loads(row["schemas"]),
-                    health_endpoint=row["health_endpoint"],
-                    status=HealthStatus(row["status"]),
-                    registered_at=datetime.fromisoformat(row["registered_at"]),
-                    last_heartbeat=datetime.fromisoformat(row["last_heartbeat"])
-                    if row["last_heartbeat"]
-                    else None,
-                    metadata=json.loads(row["metadata"]),
-                )
-                for row in rows
-            ]
+            return [self._row_to_agent_record(row) for row in rows]
         except Exception as e:
             raise QueryError(f"Failed to list agents: {e}") from e
 
@@ -254,10 +311,11 @@ class SQLitePersistenceAdapter(BasePersistenceAdapter):
         """Remove agent"""
         assert self.conn is not None, "Adapter not connected"
         try:
-            await self.conn.execute(
-                "DELETE FROM agents WHERE identity = ?", (identity,)
-            )
-            await self.conn.commit()
+            async with self._write_lock:
+                await self.conn.execute(
+                    "DELETE FROM agents WHERE identity = ?", (identity,)
+                )
+                await self.conn.commit()
         except Exception as e:
             raise QueryError(f"Failed to deregister agent: {e}") from e
 
@@ -272,27 +330,28 @@ class SQLitePersistenceAdapter(BasePersistenceAdapter):
         now = datetime.now(UTC).isoformat()
 
         try:
-            await self.conn.execute(
-                """
-                INSERT INTO knowledge_bases (
-                    id, kb_id, kb_type, endpoint, operations,
-                    schema, health_endpoint, status, registered_at, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    kb_record_id,
-                    kb.kb_id,
-                    kb.kb_type,
-                    kb.endpoint,
-                    json.dumps(kb.operations),
-                    json.dumps(kb.kb_schema),
-                    kb.health_endpoint,
-                    HealthStatus.OFFLINE.value,
-                    now,
-                    json.dumps(kb.metadata),
-                ),
-            )
-            await self.conn.commit()
+            async with self._write_lock:
+                await self.conn.execute(
+                    """
+                    INSERT INTO knowledge_bases (
+                        id, kb_id, kb_type, endpoint, operations,
+                        schema, health_endpoint, status, registered_at, metadata
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        kb_record_id,
+                        kb.kb_id,
+                        kb.kb_type,
+                        kb.endpoint,
+                        json.dumps(kb.operations),
+                        json.dumps(kb.kb_schema),
+                        kb.health_endpoint,
+                        HealthStatus.OFFLINE.value,
+                        now,
+                        json.dumps(kb.metadata),
+                    ),
+                )
+                await self.conn.commit()
             return kb_record_id
         except aiosqlite.IntegrityError as e:
             raise DuplicateRecordError(
@@ -336,15 +395,16 @@ class SQLitePersistenceAdapter(BasePersistenceAdapter):
         assert self.conn is not None, "Adapter not connected"
         now = datetime.now(UTC).isoformat()
         try:
-            await self.conn.execute(
-                """
-                UPDATE knowledge_bases
-                SET status = ?, last_health_check = ?
-                WHERE kb_id = ?
-                """,
-                (status, now, kb_id),
-            )
-            await self.conn.commit()
+            async with self._write_lock:
+                await self.conn.execute(
+                    """
+                    UPDATE knowledge_bases
+                    SET status = ?, last_health_check = ?
+                    WHERE kb_id = ?
+                    """,
+                    (status, now, kb_id),
+                )
+                await self.conn.commit()
         except Exception as e:
             raise QueryError(f"Failed to update KB status: {e}") from e
 
@@ -353,15 +413,16 @@ class SQLitePersistenceAdapter(BasePersistenceAdapter):
         assert self.conn is not None, "Adapter not connected"
         try:
             operations_json = json.dumps(operations)
-            await self.conn.execute(
-                """
-                UPDATE knowledge_bases
-                SET operations = ?
-                WHERE kb_id = ?
-                """,
-                (operations_json, kb_id),
-            )
-            await self.conn.commit()
+            async with self._write_lock:
+                await self.conn.execute(
+                    """
+                    UPDATE knowledge_bases
+                    SET operations = ?
+                    WHERE kb_id = ?
+                    """,
+                    (operations_json, kb_id),
+                )
+                await self.conn.commit()
         except Exception as e:
             raise QueryError(f"Failed to update KB operations: {e}") from e
 
@@ -416,13 +477,33 @@ class SQLitePersistenceAdapter(BasePersistenceAdapter):
         """Remove KB from registry"""
         assert self.conn is not None, "Adapter not connected"
         try:
-            await self.conn.execute(
-                "DELETE FROM knowledge_bases WHERE kb_id = ?", (kb_id,)
-            )
-            await self.conn.commit()
+            async with self._write_lock:
+                await self.conn.execute(
+                    "DELETE FROM knowledge_bases WHERE kb_id = ?", (kb_id,)
+                )
+                await self.conn.commit()
         except Exception as e:
             raise QueryError(f"Failed to deregister KB: {e}") from e
 
+    async def deregister_many(self, identities: list[str], kb_ids: list[str]) -> None:
+        """Remove agents and KBs by id in a single transaction"""
+        assert self.conn is not None, "Adapter not connected"
+        try:
+            async with self._write_lock:
+                for table, column, ids in (
+                    ("agents", "identity", identities),
+                    ("knowledge_bases", "kb_id", kb_ids),
+                ):
+                    if ids:
+                        placeholders = ", ".join("?" * len(ids))
+                        await self.conn.execute(
+                            f"DELETE FROM {table} WHERE {column} IN ({placeholders})",
+                            ids,
+                        )
+                await self.conn.commit()
+        except Exception as e:
+            raise QueryError(f"Failed to deregister entities: {e}") from e
+
     # ============================================
     # POLICY STORE
     # ============================================
@@ -434,25 +515,26 @@ class SQLitePersistenceAdapter(BasePersistenceAdapter):
         now = datetime.now(UTC).isoformat()
 
         try:
-            await self.conn.execute(
-                """
-                INSERT INTO policies (
-                    id, policy_name, rules, precedence, active,
-                    created_at, updated_at, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    policy_id,
-                    policy.policy_name,
-                    json.dumps([rule.model_dump() for rule in policy.rules]),
-                    policy.precedence,
-                    1 if policy.active else 0,
-                    now,
-                    now,
-                    json.dumps(policy.metadata),
-                ),
-            )
-            await self.conn.commit()
+            async with self._write_lock:
+                await self.conn.execute(
+                    """
+                    INSERT INTO policies (
+                        id, policy_name, rules, precedence, active,
+                        created_at, updated_at, metadata
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        policy_id,
+                        policy.policy_name,
+                        json.dumps([rule.model_dump() for rule in policy.rules]),
+                        policy.precedence,
+                        1 if policy.active else 0,
+                        now,
+                        now,
+                        json.dumps(policy.metadata),
+                    ),
+                )
+                await self.conn.commit()
             return policy_id
         except aiosqlite.IntegrityError as e:
             raise DuplicateRecordError(
@@ -522,22 +604,23 @@ class SQLitePersistenceAdapter(BasePersistenceAdapter):
         assert self.conn is not None, "Adapter not connected"
         now = datetime.now(UTC).isoformat()
         try:
-            await self.conn.execute(
-                """
-                UPDATE policies
-                SET rules = ?, precedence = ?, active = ?, updated_at = ?, metadata = ?
-                WHERE policy_name = ?
-                """,
-                (
-                    json.dumps([rule.model_dump() for rule in policy.rules]),
-                    policy.precedence,
-                    1 if policy.active else 0,
-                    now,
-                    json.dumps(policy.metadata),
-                    policy_name,
-                ),
-            )
-            await self.conn.commit()
+            async with self._write_lock:
+                await self.conn.execute(
+                    """
+                    UPDATE policies
+                    SET rules = ?, precedence = ?, active = ?, updated_at = ?, metadata = ?
+                    WHERE policy_name = ?
+                    """,
+                    (
+                        json.dumps([rule.model_dump() for rule in policy.rules]),
+                        policy.precedence,
+                        1 if policy.active else 0,
+                        now,
+                        json.dumps(policy.metadata),
+                        policy_name,
+                    ),
+                )
+                await self.conn.commit()
         except Exception as e:
             raise QueryError(f"Failed to update policy: {e}") from e
 
@@ -545,10 +628,11 @@ class SQLitePersistenceAdapter(BasePersistenceAdapter):
         """Delete policy"""
         assert self.conn is not None, "Adapter not connected"
         try:
-            await self.conn.execute(
-                "DELETE FROM policies WHERE policy_name = ?", (policy_name,)
-            )
-            await self.conn.commit()
+            async with self._write_lock:
+                await self.conn.execute(
+                    "DELETE FROM policies WHERE policy_name = ?", (policy_name,)
+                )
+                await self.conn.commit()
         except Exception as e:
             raise QueryError(f"Failed to delete policy: {e}") from e
 
@@ -607,162 +691,220 @@ class SQLitePersistenceAdapter(BasePersistenceAdapter):
         event_id = str(uuid.uuid4())
 
         try:
-            await self.conn.execute(
-                """
-                INSERT INTO audit_logs (
-                    id, event_type, source_id, target_id, outcome, timestamp,
-                    request_metadata, policy_decision, masked_fields,
-                    full_request, full_response, provenance_chain
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    event_id,
-                    event.event_type.value,
-                    event.source_id,
-                    event.target_id,
-                    event.outcome.value,
-                    event.timestamp.isoformat(),
-                    json.dumps(event.request_metadata)
-                    if event.request_metadata
-                    else None,
-                    json.dumps(event.policy_decision)
-                    if event.policy_decision
-                    else None,
-                    json.dumps(event.masked_fields) if event.masked_fields else None,
-                    json.dumps(event.full_request) if event.full_request else None,
-                    json.dumps(event.full_response) if event.full_response else None,
-                    json.dumps(event.provenance_chain)
-                    if event.provenance_chain
-                    else None,
-                ),
-            )
-            await self.conn.commit()
+            async with self._write_lock:
+                await self.conn.execute(
+                    _AUDIT_INSERT_SQL, self._audit_event_params(event_id, event)
+                )
+                await self.conn.commit()
             return event_id
         except Exception as e:
             raise QueryError(f"Failed to log audit event: {e}") from e
 
+    async def write_audit_logs_bulk(self, events: list[AuditEvent]) -> list[str]:
+        """Log a batch of audit events in a single transaction"""
+        assert self.conn is not None, "Adapter not connected"
+        event_ids = [str(uuid.uuid4()) for _ in events]
+
+        try:
+            async with self._write_lock:
+                await self.conn.executemany(
+                    _AUDIT_INSERT_SQL,
+                    [
+                        self._audit_event_params(event_id, event)
+                        for event_id, event in zip(event_ids, events, strict=True)
+                    ],
+                )
+                await self.conn.commit()
+            return event_ids
+        except Exception as e:
+            raise QueryError(f"Failed to log audit events: {e}") from e
+
+    def _audit_event_params(self, event_id: str, event: AuditEvent) -> tuple:
+        """Translate an AuditEvent to audit_logs insert parameters"""
+        return (
+            event_id,
+            event.event_type.value,
+            event.source_id,
+            event.target_id,
+            event.outcome.value,
+            event.timestamp.isoformat(),
+            json.dumps(event.request_metadata) if event.request_metadata else None,
+            json.dumps(event.policy_decision) if event.policy_decision else None,
+            json.dumps(event.masked_fields) if event.masked_fields else None,
+            json.dumps(event.full_request) if event.full_request else None,
+            json.dumps(event.full_response) if event.full_response else None,
+            json.dumps(event.provenance_chain) if event.provenance_chain else None,
+        )
+
     async def query_audit_logs(self, query: AuditQuery) -> list[AuditRecord]:
         """Query audit logs"""
         assert self.conn is not None, "Adapter not connected"
         try:
-            conditions = []
-            params: list[Any] = []
-
-            if query.event_type:
-                conditions.append("event_type = ?")
-                params.append(query.event_type.value)
-
-            if query.source_id:
-                conditions.append("source_id = ?")
-                params.append(query.source_id)
-
-            if query.target_id:
-                conditions.append("target_id = ?")
-                params.append(query.target_id)
-
-            if query.outcome:
-                conditions.append("outcome = ?")
-                params.append(query.outcome.value)
-
-            if query.start_time:
-                conditions.append("timestamp >= ?")
-                params.append(query.start_time.isoformat())
+            cursor = await self.conn.execute(*self._audit_query_sql(query))
+            rows = await cursor.fetchall()
 
-            if query.end_time:
-                conditions.append("timestamp <= ?")
-                params.append(query.end_time.isoformat())
+            return [self._row_to_audit_record(row) for row in rows]
+        except Exception as e:
+            raise QueryError(f"Failed to query audit logs: {e}") from e
 
-            where_clause = " AND ".join(conditions) if conditions else "1=1"
-            sql = f"SELECT * FROM audit_logs WHERE {where_clause} ORDER BY timestamp DESC LIMIT ?"
-            params.append(query.limit)
+    async def iter_audit_logs(self, query: AuditQuery) -> AsyncIterator[AuditRecord]:
+        """Stream audit logs, reading rows from the cursor in chunks"""
+        assert self.conn is not None, "Adapter not connected"
+        try:
+            async with self.conn.execute(*self._audit_query_sql(query)) as cursor:
+                async for row in cursor:
+                    yield self._row_to_audit_record(row)
+        except Exception as e:
+            raise QueryError(f"Failed to query audit logs: {e}") from e
 
-            cursor = await self.conn.execute(sql, params)
-            rows = await cursor.fetchall()
+    def _audit_query_sql(self, query: AuditQuery) -> tuple[str, list[Any]]:
+        """Build the SELECT text and parameters for an AuditQuery.
 
-            return [
-                AuditRecord(
-                    id=row["id"],
-                    event_type=row["event_type"],
-                    source_id=row["source_id"],
-                    target_id=row["target_id"],
-                    outcome=row["outcome"],
-                    timestamp=datetime.fromisoformat(row["timestamp"]),
-                    request_metadata=json.loads(row["request_metadata"])
-                    if row["request_metadata"]
-                    else None,
-                    policy_decision=json.loads(row["policy_decision"])
-                    if row["policy_decision"]
-                    else None,
-                    masked_fields=json.loads(row["masked_fields"])
-                    if row["masked_fields"]
-                    else None,
-                    full_request=json.loads(row["full_request"])
-                    if row["full_request"]
-                    else None,
-                    full_response=json.loads(row["full_response"])
-                    if row["full_response"]
-                    else None,
-                    provenance_chain=json.loads(row["provenance_chain"])
-                    if row["provenance_chain"]
-                    else None,
+        A filter applies whenever it is set, even to an empty value, so an
+        empty id matches nothing rather than being dropped.
+        """
+        conditions = []
+        params: list[Any] = []
+
+        if query.event_type is not None:
+            conditions.append("event_type = ?")
+            params.append(query.event_type.value)
+
+        if query.source_id is not None:
+            conditions.append("source_id = ?")
+            params.append(query.source_id)
+
+        if query.source_ids is not None:
+            placeholders = ", ".join("?" * len(query.source_ids))
+            conditions.append(f"source_id IN ({placeholders})")
+            params.extend(query.source_ids)
+
+        if query.target_id is not None:
+            conditions.append("target_id = ?")
+            params.append(query.target_id)
+
+        if query.outcome is not None:
+            conditions.append("outcome = ?")
+            params.append(query.outcome.value)
+
+        # Always bound the time range so the query stays an index range
+        # seek instead of scanning the whole audit history
+        start_time = query.start_time
+        if start_time is None:
+            audit_config = (self.config or {}).get("audit", {})
+            window_days = audit_config.get("default_query_days", 30)
+            start_time = datetime.now(UTC) - timedelta(days=window_days)
+            if not self._warned_unbounded_audit_query:
+                self._warned_unbounded_audit_query = True
+                logger.warning(
+                    f"Audit queries without start_time are limited to the last "
+                    f"{window_days} days"
                 )
-                for row in rows
-            ]
+        conditions.append("timestamp >= ?")
+        params.append(start_time.isoformat())
+
+        if query.end_time is not None:
+            conditions.append("timestamp <= ?")
+            params.append(query.end_time.isoformat())
+
+        where_clause = " AND ".join(conditions)
+        sql = f"SELECT * FROM audit_logs WHERE {where_clause} ORDER BY timestamp DESC LIMIT ?"
+        params.append(query.limit)
+        return sql, params
+
+    async def query_audit_logs_prepared(
+        self,
+        event_type: AuditEventType | None = None,
+        source_id: str | None = None,
+        target_id: str | None = None,
+        limit: int = 100,
+    ) -> list[AuditRecord]:
+        """Query audit logs by equality filters.
+
+        Keyword shorthand for query_audit_logs, built by the same
+        _audit_query_sql so both apply the same filters and default time
+        window. Suited to polling: repeated calls with the same filter
+        columns produce identical SQL text, which sqlite3's statement cache
+        reuses without recompiling.
+
+        Args:
+            event_type: Optional event type to match
+            source_id: Optional source identifier to match
+            target_id: Optional target identifier to match
+            limit: Maximum number of records to return
+
+        Returns:
+            Matching audit records, newest first
+        """
+        assert self.conn is not None, "Adapter not connected"
+        query = AuditQuery(
+            event_type=event_type,
+            source_id=source_id,
+            target_id=target_id,
+            limit=limit,
+        )
+        try:
+            cursor = await self.conn.execute(*self._audit_query_sql(query))
+            rows = await cursor.fetchall()
+            return [self._row_to_audit_record(row) for row in rows]
         except Exception as e:
             raise QueryError(f"Failed to query audit logs: {e}") from e
 
+    def _row_to_audit_record(self, row: aiosqlite.Row) -> AuditRecord:
+        """Convert an audit_logs row to an AuditRecord"""
+        return AuditRecord(
+            id=row["id"],
+            event_type=AuditEventType(row["event_type"]),
+            source_id=row["source_id"],
+            target_id=row["target_id"],
+            outcome=AuditOutcome(row["outcome"]),
+            timestamp=datetime.fromisoformat(row["timestamp"]),
+            request_metadata=json.loads(row["request_metadata"])
+            if row["request_metadata"]
+            else None,
+            policy_decision=json.loads(row["policy_decision"])
+            if row["policy_decision"]
+            else None,
+            masked_fields=json.loads(row["masked_fields"])
+            if row["masked_fields"]
+            else None,
+            full_request=json.loads(row["full_request"])
+            if row["full_request"]
+            else None,
+            full_response=json.loads(row["full_response"])
+            if row["full_response"]
+            else None,
+            provenance_chain=json.loads(row["provenance_chain"])
+            if row["provenance_chain"]
+            else None,
+        )
+
     async def get_audit_stats(self, source_id: str | None = None) -> dict:
         """Get audit statistics"""
         assert self.conn is not None, "Adapter not connected"
         try:
-            # Count by outcome
-            if source_id:
-                cursor = await self.conn.execute(
-                    """
-                    SELECT outcome, COUNT(*) as count
-                    FROM audit_logs
-                    WHERE source_id = ?
-                    GROUP BY outcome
-                    """,
-                    (source_id,),
-                )
-            else:
-                cursor = await self.conn.execute(
-                    """
-                    SELECT outcome, COUNT(*) as count
-                    FROM audit_logs
-                    GROUP BY outcome
-                    """
-                )
-
-            outcome_counts = {
-                row["outcome"]: row["count"] for row in await cursor.fetchall()
-            }
+            # Count both groupings in one pass over the matching rows
+            where_clause = "WHERE source_id = ?" if source_id else ""
+            cursor = await self.conn.execute(
+                f"""
+                SELECT outcome, event_type, COUNT(*) as count
+                FROM audit_logs
+                {where_clause}
+                GROUP BY outcome, event_type
+                """,
+                (source_id,) if source_id else (),
+            )
 
-            # Count by event type
-            if source_id:
-                cursor = await self.conn.execute(
-                    """
-                    SELECT event_type, COUNT(*) as count
-                    FROM audit_logs
-                    WHERE source_id = ?
-                    GROUP BY event_type
-                    """,
-                    (source_id,),
+            outcome_counts: dict[str, int] = {}
+            event_type_counts: dict[str, int] = {}
+            for row in await cursor.fetchall():
+                outcome_counts[row["outcome"]] = (
+                    outcome_counts.get(row["outcome"], 0) + row["count"]
                 )
-            else:
-                cursor = await self.conn.execute(
-                    """
-                    SELECT event_type, COUNT(*) as count
-                    FROM audit_logs
-                    GROUP BY event_type
-                    """
+                event_type_counts[row["event_type"]] = (
+                    event_type_counts.get(row["event_type"], 0) + row["count"]
                 )
 
-            event_type_counts = {
-                row["event_type"]: row["count"] for row in await cursor.fetchall()
-            }
-
             return {
                 "outcome_counts": outcome_counts,
                 "event_type_counts": event_type_counts,
@@ -31,6 +31,8 @@ async def run_migrations(conn: aiosqlite.Connection) -> None:
         (2, create_kb_registry_table),
         (3, create_policy_tables),
         (4, create_audit_log_table),
+        (5, create_audit_log_time_indexes),
+        (6, create_agent_capabilities_table),
     ]
 
     for version, migration_func in migrations:
@@ -139,3 +141,79 @@ async def create_audit_log_table(conn: aiosqlite.Connection):
     await conn.execute("CREATE INDEX idx_audit_target ON audit_logs(target_id)")
     await conn.execute("CREATE INDEX idx_audit_timestamp ON audit_logs(timestamp)")
     await conn.execute("CREATE INDEX idx_audit_outcome ON audit_logs(outcome)")
+
+
+async def create_audit_log_time_indexes(conn: aiosqlite.Connection):
+    """Migration 5: Audit log (entity, timestamp) indexes
+
+    Audit queries filter on source or target and order by timestamp, so a
+    composite index serves both the equality seek and the time range/order.
+    The equality column leads; the single-column indexes it supersedes are
+    dropped.
+    """
+    await conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_audit_target_ts "
+        "ON audit_logs(target_id, timestamp DESC)"
+    )
+    await conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_audit_source_ts "
+        "ON audit_logs(source_id, timestamp DESC)"
+    )
+    await conn.execute("DROP INDEX IF EXISTS idx_audit_target")
+    await conn.execute("DROP INDEX IF EXISTS idx_audit_source")
+
+
+async def create_agent_capabilities_table(conn: aiosqlite.Connection):
+    """Migration 6: Agent capability lookup table
+
+    One row per (capability, agent) so capability filters are an index seek
+    instead of a json_each walk over every agent. Triggers keep it in step
+    with agents.capabilities inside the writing transaction.
+    """
+    await conn.execute(
+        """
+        CREATE TABLE agent_capabilities (
+            capability TEXT NOT NULL,
+            identity TEXT NOT NULL,
+            PRIMARY KEY (capability, identity)
+        ) WITHOUT ROWID
+    """
+    )
+    await conn.execute(
+        """
+        CREATE TRIGGER trg_agents_capabilities_insert AFTER INSERT ON agents
+        BEGIN
+            INSERT OR IGNORE INTO agent_capabilities (capability, identity)
+            SELECT value, NEW.identity FROM json_each(NEW.capabilities);
+        END
+    """
+    )
+    await conn.execute(
+        """
+        CREATE TRIGGER trg_agents_capabilities_update
+        AFTER UPDATE OF capabilities ON agents
+        BEGIN
+            DELETE FROM agent_capabilities
+            WHERE identity = NEW.identity
+              AND capability NOT IN (SELECT value FROM json_each(NEW.capabilities));
+            INSERT OR IGNORE INTO agent_capabilities (capability, identity)
+            SELECT value, NEW.identity FROM json_each(NEW.capabilities);
+        END
+    """
+    )
+    await conn.execute(
+        """
+        CREATE TRIGGER trg_agents_capabilities_delete AFTER DELETE ON agents
+        BEGIN
+            DELETE FROM agent_capabilities WHERE identity = OLD.identity;
+        END
+    """
+    )
+    # Backfill agents registered before this migration
+    await conn.execute(
+        """
+        INSERT OR IGNORE INTO agent_capabilities (capability, identity)
+        SELECT json_each.value, agents.identity
+        FROM agents, json_each(agents.capabilities)
+    """
+    )
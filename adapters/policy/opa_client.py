@@ -29,6 +29,9 @@ class OPAClient:
         self.timeout = timeout
         self.client = httpx.AsyncClient(timeout=timeout)
         self.policies_dir = Path(policies_dir)
+        # Bumped on every successful upload or delete through this client, so
+        # decision caches built on it can tell when policies have changed
+        self.policy_generation = 0
 
     async def close(self) -> None:
         """Close the HTTP client."""
@@ -220,6 +223,7 @@ class OPAClient:
                 headers={"Content-Type": "text/plain"},
             )
             response.raise_for_status()
+            self.policy_generation += 1
 
             logger.info(f"Successfully uploaded policy to OPA: {policy_id}")
 
@@ -275,6 +279,7 @@ class OPAClient:
             # Delete from OPA
             response = await self.client.delete(f"{self.url}/v1/policies/{policy_id}")
             response.raise_for_status()
+            self.policy_generation += 1
 
             logger.info(f"Successfully deleted policy from OPA: {policy_id}")
 
@@ -34,23 +34,25 @@ class AutonomousOpenAIAgent:
         self,
         agent_id: str,
         task: str,
-        openai_api_key: str,
+        openai_api_key: str | None,
         model: str = "gpt-4o-mini",
         nats_url: str = "nats://localhost:4222",
+        openai_client: OpenAI | None = None,
     ):
         """Initialize autonomous agent.
         
         Args:
             agent_id: Unique agent identifier
             task: The task to accomplish
-            openai_api_key: OpenAI API key
+            openai_api_key: OpenAI API key (unused when openai_client is given)
             model: OpenAI model to use
             nats_url: NATS server URL
+            openai_client: Pre-built client, e.g. one replaying recorded responses
         """
         self.agent_id = agent_id
         self.task = task
         self.model = model
-        self.openai_client = OpenAI(api_key=openai_api_key)
+        self.openai_client = openai_client or OpenAI(api_key=openai_api_key)
         
         # NATS connection (only interface to mesh)
         self.nats = NATSWrapper(url=nats_url)
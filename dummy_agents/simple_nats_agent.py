@@ -10,11 +10,11 @@ It only knows:
 This represents how external agents will interact with the mesh.
 """
 import asyncio
-import json
 import logging
 from typing import Any
 
 import nats
+import orjson
 from nats.aio.client import Client as NATS
 
 logger = logging.getLogger(__name__)
@@ -31,15 +31,20 @@ class SimpleNATSAgent:
     - Dynamic discovery of capabilities
     """
 
-    def __init__(self, nats_url: str = "nats://localhost:4222"):
+    def __init__(
+        self, nats_url: str = "nats://localhost:4222", nc: NATS | None = None
+    ):
         """
         Initialize agent.
         
         Args:
             nats_url: NATS server URL
+            nc: Optional already-connected NATS client to share with other
+                agents; the agent then never closes it on disconnect
         """
         self.nats_url = nats_url
-        self.nc: NATS | None = None
+        self.nc: NATS | None = nc
+        self._owns_connection = nc is None
         self.identity: str | None = None
         self.subscriptions = []
 
@@ -48,7 +53,11 @@ class SimpleNATSAgent:
         Connect to the mesh via NATS.
         
         This is the ONLY connection method - no direct access to mesh services.
+        A no-op when the agent was given a shared connection.
         """
+        if not self._owns_connection:
+            return
+
         try:
             self.nc = await nats.connect(self.nats_url)
             logger.info(f"✅ Connected to NATS at {self.nats_url}")
@@ -64,8 +73,9 @@ class SimpleNATSAgent:
                 await sub.unsubscribe()
             self.subscriptions.clear()
 
-            await self.nc.close()
-            logger.info("✅ Disconnected from NATS")
+            if self._owns_connection:
+                await self.nc.close()
+                logger.info("✅ Disconnected from NATS")
 
     async def register_with_mesh(
         self,
@@ -111,11 +121,11 @@ class SimpleNATSAgent:
             # Send registration request via NATS request-reply
             response = await self.nc.request(
                 "mesh.registry.agent.register",
-                json.dumps(registration_msg).encode(),
+                orjson.dumps(registration_msg),
                 timeout=5.0,
             )
 
-            result = json.loads(response.data.decode())
+            result = orjson.loads(response.data)
 
             if "error" in result:
                 logger.error(f"❌ Registration failed: {result['error']}")
@@ -174,11 +184,11 @@ class SimpleNATSAgent:
         try:
             response = await self.nc.request(
                 "mesh.registry.kb.register",
-                json.dumps(registration_msg).encode(),
+                orjson.dumps(registration_msg),
                 timeout=5.0,
             )
 
-            result = json.loads(response.data.decode())
+            result = orjson.loads(response.data)
 
             if "error" in result:
                 logger.error(f"❌ KB registration failed: {result['error']}")
@@ -227,11 +237,11 @@ class SimpleNATSAgent:
         try:
             response = await self.nc.request(
                 "mesh.directory.query",
-                json.dumps(query_msg).encode(),
+                orjson.dumps(query_msg),
                 timeout=5.0,
             )
 
-            result = json.loads(response.data.decode())
+            result = orjson.loads(response.data)
 
             if "error" in result:
                 logger.error(f"❌ Discovery failed: {result['error']}")
@@ -280,11 +290,11 @@ class SimpleNATSAgent:
         try:
             response = await self.nc.request(
                 "mesh.directory.query",
-                json.dumps(query_msg).encode(),
+                orjson.dumps(query_msg),
                 timeout=5.0,
             )
 
-            result = json.loads(response.data.decode())
+            result = orjson.loads(response.data)
 
             if "error" in result:
                 logger.error(f"❌ KB discovery failed: {result['error']}")
@@ -340,11 +350,11 @@ class SimpleNATSAgent:
         try:
             response = await self.nc.request(
                 "mesh.routing.kb_query",
-                json.dumps(query_msg).encode(),
+                orjson.dumps(query_msg),
                 timeout=timeout,
             )
 
-            result = json.loads(response.data.decode())
+            result = orjson.loads(response.data)
 
             if result.get("status") == "denied":
                 logger.warning(f"🚫 KB query denied: {result.get('error')}")
@@ -402,11 +412,11 @@ class SimpleNATSAgent:
         try:
             response = await self.nc.request(
                 "mesh.routing.agent_invoke",
-                json.dumps(invoke_msg).encode(),
+                orjson.dumps(invoke_msg),
                 timeout=timeout,
             )
 
-            result = json.loads(response.data.decode())
+            result = orjson.loads(response.data)
 
             if result.get("status") == "denied":
                 logger.warning(f"🚫 Agent invocation denied: {result.get('error')}")
@@ -426,6 +436,9 @@ class SimpleNATSAgent:
     async def subscribe_to_directory_updates(self, callback) -> None:
         """
         Subscribe to directory updates (new agents/KBs registered).
+
+        Returns once the subscription is live on the server, so no update
+        published after this call can be missed.
         
         Args:
             callback: Async callback function(message: dict)
@@ -435,18 +448,22 @@ class SimpleNATSAgent:
 
         async def handler(msg):
             try:
-                data = json.loads(msg.data.decode())
+                data = orjson.loads(msg.data)
                 await callback(data)
             except Exception as e:
                 logger.error(f"❌ Error in directory update handler: {e}")
 
         sub = await self.nc.subscribe("mesh.directory.updates", cb=handler)
         self.subscriptions.append(sub)
+        # Return only once the server has processed the SUB
+        await self.nc.flush()
         logger.info("✅ Subscribed to directory updates")
 
     async def subscribe_to_invocations(self, callback) -> None:
         """
         Subscribe to invocation requests for this agent.
+
+        Returns once the subscription is live on the server.
         
         Args:
             callback: Async callback function(message: dict)
@@ -459,7 +476,7 @@ class SimpleNATSAgent:
 
         async def handler(msg):
             try:
-                data = json.loads(msg.data.decode())
+                data = orjson.loads(msg.data)
                 await callback(data)
             except Exception as e:
                 logger.error(f"❌ Error in invocation handler: {e}")
@@ -467,11 +484,15 @@ class SimpleNATSAgent:
         subject = f"mesh.agent.{self.identity}.invoke"
         sub = await self.nc.subscribe(subject, cb=handler)
         self.subscriptions.append(sub)
+        # Return only once the server has processed the SUB
+        await self.nc.flush()
         logger.info(f"✅ Subscribed to invocations on {subject}")
 
     async def subscribe_to_notifications(self, callback) -> None:
         """
         Subscribe to notifications for this agent.
+
+        Returns once the subscription is live on the server.
         
         Args:
             callback: Async callback function(message: dict)
@@ -484,7 +505,7 @@ class SimpleNATSAgent:
 
         async def handler(msg):
             try:
-                data = json.loads(msg.data.decode())
+                data = orjson.loads(msg.data)
                 await callback(data)
             except Exception as e:
                 logger.error(f"❌ Error in notification handler: {e}")
@@ -492,6 +513,8 @@ class SimpleNATSAgent:
         subject = f"mesh.agent.{self.identity}.notifications"
         sub = await self.nc.subscribe(subject, cb=handler)
         self.subscriptions.append(sub)
+        # Return only once the server has processed the SUB
+        await self.nc.flush()
         logger.info(f"✅ Subscribed to notifications on {subject}")
 
     async def send_completion(
@@ -525,7 +548,7 @@ class SimpleNATSAgent:
             completion_msg["error"] = error
 
         await self.nc.publish(
-            "mesh.routing.completion", json.dumps(completion_msg).encode()
+            "mesh.routing.completion", orjson.dumps(completion_msg)
         )
         logger.info(f"✅ Sent completion for tracking_id: {tracking_id}")
 
@@ -589,11 +612,11 @@ class SimpleNATSAgent:
         try:
             response = await self.nc.request(
                 "mesh.audit.query",
-                json.dumps(query_msg).encode(),
+                orjson.dumps(query_msg),
                 timeout=10.0,
             )
 
-            result = json.loads(response.data.decode())
+            result = orjson.loads(response.data)
 
             if "error" in result:
                 logger.error(f"❌ Audit query failed: {result['error']}")
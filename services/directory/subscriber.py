@@ -100,6 +100,21 @@ class DirectorySubscriber:
             logger.error(f"Failed to load directory from persistence: {e}")
             raise
 
+    def invalidate(self, kb_id: str) -> None:
+        """
+        Drop a single KB from the cache without touching persistence.
+
+        Args:
+            kb_id: KB identifier
+        """
+        self.directory_cache["kbs"] = [
+            k for k in self.directory_cache["kbs"] if k.get("kb_id") != kb_id
+        ]
+
+    def invalidate_all(self) -> None:
+        """Clear the cache; it refills from subsequent directory updates."""
+        self.directory_cache = {"agents": [], "kbs": []}
+
     async def _handle_update(self, message: dict[str, Any]) -> None:
         """
         Handle directory update notifications.
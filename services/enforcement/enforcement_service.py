@@ -1,12 +1,13 @@
 """Enforcement service for policy evaluation and data masking."""
 
 import logging
-from datetime import UTC, datetime
+import time
 from typing import Any
 
 from adapters.knowledge_base.neo4j.adapter import Neo4jAdapter
 from adapters.knowledge_base.postgres.adapter import PostgresAdapter
 from adapters.messaging.nats_client import NATSWrapper
+from adapters.persistence.audit_buffer import AuditBuffer
 from adapters.persistence.base import BasePersistenceAdapter
 from adapters.persistence.schemas import AuditEvent, AuditEventType, AuditOutcome
 from adapters.policy.opa_client import OPAClient
@@ -32,6 +33,8 @@ class EnforcementService:
         persistence: BasePersistenceAdapter,
         kb_adapters: dict[str, PostgresAdapter | Neo4jAdapter],
         nats_client: NATSWrapper | None = None,
+        denial_cache_ttl: float = 0.0,
+        audit_buffer: AuditBuffer | None = None,
     ):
         """Initialize enforcement service.
 
@@ -40,12 +43,30 @@ class EnforcementService:
             persistence: Persistence adapter for audit logging and registry lookups
             kb_adapters: Dictionary mapping kb_type -> adapter instance (for fallback)
             nats_client: Optional NATS client for message broker pattern
+            denial_cache_ttl: Seconds to reuse a denied invocation decision
+                without asking OPA again (0 disables caching). Uploads and
+                deletes made through opa_client drop the cache automatically;
+                after policy changes made any other way, call
+                invalidate_decision_cache()
+            audit_buffer: Optional started AuditBuffer; when given, audit events
+                are queued and written in batches instead of one by one
         """
         self.opa = opa_client
         self.persistence = persistence
         self.kb_adapters = kb_adapters
         self.nats = nats_client
         self.use_nats = nats_client is not None
+        self.denial_cache_ttl = denial_cache_ttl
+        self.audit_buffer = audit_buffer
+        self._denied_invocations: dict[
+            tuple[str, str, str], tuple[float, dict[str, Any]]
+        ] = {}
+        self._cached_policy_generation = opa_client.policy_generation
+
+    def invalidate_decision_cache(self) -> None:
+        """Drop cached invocation denials (call after policies change)."""
+        self._denied_invocations.clear()
+        self._cached_policy_generation = self.opa.policy_generation
 
     async def enforce_kb_access(
         self,
@@ -79,7 +100,7 @@ class EnforcementService:
             AccessDeniedError: If policy denies access
             Exception: If KB lookup or operation fails
         """
-        start_time = datetime.now(UTC)
+        start_ns = time.perf_counter_ns()
 
         try:
             # Step 1: Look up KB in registry
@@ -131,7 +152,7 @@ class EnforcementService:
 
             # Step 6: Log successful access
             await self._log_successful_access(
-                requester_id, kb_id, operation, masking_rules, start_time
+                requester_id, kb_id, operation, masking_rules, start_ns
             )
 
             # Step 7: Return masked response
@@ -178,15 +199,23 @@ class EnforcementService:
             AccessDeniedError: If policy denies invocation
         """
         try:
-            # Step 1: Evaluate policy using OPA
-            decision = await self.opa.evaluate_policy(
-                principal_type="agent",
-                principal_id=source_agent_id,
-                resource_type="agent",
-                resource_id=target_agent_id,
-                action="invoke",
-                context={"operation": operation},
-            )
+            # Step 1: Evaluate policy using OPA (denials may be served from cache)
+            cache_key = (source_agent_id, target_agent_id, operation)
+            decision = self._cached_denial(cache_key)
+            if decision is None:
+                decision = await self.opa.evaluate_policy(
+                    principal_type="agent",
+                    principal_id=source_agent_id,
+                    resource_type="agent",
+                    resource_id=target_agent_id,
+                    action="invoke",
+                    context={"operation": operation},
+                )
+                if self.denial_cache_ttl > 0 and not decision.get("allow", False):
+                    self._denied_invocations[cache_key] = (
+                        time.monotonic() + self.denial_cache_ttl,
+                        decision,
+                    )
 
             # Step 2: Check if invocation is allowed
             if not decision.get("allow", False):
@@ -199,7 +228,7 @@ class EnforcementService:
                 )
 
             # Step 3: Log successful authorization (actual invocation logged separately)
-            await self.persistence.log_event(
+            await self._log_event(
                 AuditEvent(
                     event_type=AuditEventType.INVOKE,
                     source_id=source_agent_id,
@@ -231,6 +260,20 @@ class EnforcementService:
             await self._log_error(source_agent_id, target_agent_id, "invoke", str(e))
             raise
 
+    def _cached_denial(self, key: tuple[str, str, str]) -> dict[str, Any] | None:
+        """Return a still-valid cached denial decision for an invocation."""
+        if self.opa.policy_generation != self._cached_policy_generation:
+            self.invalidate_decision_cache()
+            return None
+        cached = self._denied_invocations.get(key)
+        if cached is None:
+            return None
+        expires_at, decision = cached
+        if time.monotonic() >= expires_at:
+            del self._denied_invocations[key]
+            return None
+        return decision
+
     async def _execute_kb_via_nats(
         self,
         kb_id: str,
@@ -378,11 +421,18 @@ class EnforcementService:
                 masked[key] = value
         return masked
 
+    async def _log_event(self, event: AuditEvent) -> None:
+        """Write an audit event, through the audit buffer when configured."""
+        if self.audit_buffer:
+            await self.audit_buffer.append(event)
+        else:
+            await self.persistence.log_event(event)
+
     async def _log_denied_access(
         self, requester_id: str, kb_id: str, operation: str, reason: str
     ) -> None:
         """Log denied KB access."""
-        await self.persistence.log_event(
+        await self._log_event(
             AuditEvent(
                 event_type=AuditEventType.QUERY,
                 source_id=requester_id,
@@ -398,11 +448,11 @@ class EnforcementService:
         kb_id: str,
         operation: str,
         masked_fields: list[str],
-        start_time: datetime,
+        start_ns: int,
     ) -> None:
         """Log successful KB access."""
-        latency = (datetime.now(UTC) - start_time).total_seconds() * 1000
-        await self.persistence.log_event(
+        latency = (time.perf_counter_ns() - start_ns) / 1_000_000
+        await self._log_event(
             AuditEvent(
                 event_type=AuditEventType.QUERY,
                 source_id=requester_id,
@@ -417,7 +467,7 @@ class EnforcementService:
         self, source_id: str, target_id: str, operation: str, reason: str
     ) -> None:
         """Log denied agent invocation."""
-        await self.persistence.log_event(
+        await self._log_event(
             AuditEvent(
                 event_type=AuditEventType.INVOKE,
                 source_id=source_id,
@@ -431,7 +481,7 @@ class EnforcementService:
         self, source_id: str, target_id: str, operation: str, error: str
     ) -> None:
         """Log error during enforcement."""
-        await self.persistence.log_event(
+        await self._log_event(
             AuditEvent(
                 event_type=AuditEventType.QUERY,
                 source_id=source_id,
@@ -55,6 +55,10 @@ class AgentService:
         """
         Register a new agent with validation and health check.
 
+        The agent record is committed before this returns, so it is visible to
+        subsequent reads without waiting; the directory notification is
+        published best-effort and not acknowledged.
+
         Args:
             request: Agent registration request
 
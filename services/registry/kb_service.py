@@ -54,6 +54,9 @@ class KBService:
         """
         Register a new knowledge base with validation and connectivity check.
 
+        Returns once the KB row is committed; the directory update on NATS is
+        fire-and-forget.
+
         Args:
             request: KB registration request
 
@@ -401,6 +404,21 @@ class KBService:
         await self.persistence.deregister_kb(kb_id)
         logger.info(f"KB '{kb_id}' deregistered successfully")
 
+    async def deregister_kbs(self, kb_ids: list[str]) -> None:
+        """
+        Remove several KBs from the registry in one persistence call.
+
+        Unlike deregister_kb, unknown IDs are ignored rather than raising.
+
+        Args:
+            kb_ids: KB identifiers
+        """
+        if not kb_ids:
+            return
+
+        await self.persistence.deregister_many([], kb_ids)
+        logger.info(f"Deregistered {len(kb_ids)} KBs")
+
     async def _publish_kb_registered(
         self, request: KBRegistrationRequest, status: str
     ) -> None:
@@ -1,5 +1,6 @@
 """Request routing service for orchestrating mesh operations."""
 
+import asyncio
 import logging
 import uuid
 from datetime import UTC, datetime
@@ -57,6 +58,7 @@ class RequestRouter:
         self.persistence = persistence
         self.nats = nats_client
         self.invocations: dict[str, InvocationRecord] = {}
+        self.completed_events: dict[str, asyncio.Event] = {}
 
     async def start(self) -> None:
         """Start the request router and subscribe to routing subjects."""
@@ -75,6 +77,9 @@ class RequestRouter:
                 "mesh.routing.completion", self._handle_completion_msg
             )
 
+            # Outgoing KB/agent requests share one reply inbox; set it up now
+            await self.nats.prewarm_request_inbox()
+
         logger.info("Request router started and listening for requests")
 
     async def stop(self) -> None:
@@ -187,17 +192,23 @@ class RequestRouter:
                 started_at=started_at,
             )
             self.invocations[tracking_id] = invocation
+            self.completed_events[tracking_id] = asyncio.Event()
 
             # Step 5: Forward to target agent via NATS
-            await self.nats.publish(
-                f"mesh.agent.{target_agent.identity}.invoke",
-                {
-                    "tracking_id": tracking_id,
-                    "source": request.source_agent_id,
-                    "operation": request.operation,
-                    "payload": request.payload,
-                },
-            )
+            try:
+                await self.nats.publish(
+                    f"mesh.agent.{target_agent.identity}.invoke",
+                    {
+                        "tracking_id": tracking_id,
+                        "source": request.source_agent_id,
+                        "operation": request.operation,
+                        "payload": request.payload,
+                    },
+                )
+            except Exception:
+                # No completion will ever arrive for this invocation
+                self.completed_events.pop(tracking_id, None)
+                raise
 
             logger.info(
                 f"Invocation routed: {request.source_agent_id} -> {request.target_agent_id} "
@@ -237,6 +248,20 @@ class RequestRouter:
                 error=str(e),
             )
 
+    async def wait_completed(self, tracking_id: str) -> None:
+        """
+        Wait until an invocation's completion has been recorded and audited.
+
+        Returns immediately if the completion was already handled or the
+        tracking ID is unknown.
+
+        Args:
+            tracking_id: Tracking ID of the invocation
+        """
+        completed_event = self.completed_events.get(tracking_id)
+        if completed_event is not None:
+            await completed_event.wait()
+
     async def get_invocation_status(
         self, tracking_id: str
     ) -> AgentInvokeResponse | None:
@@ -401,8 +426,14 @@ class RequestRouter:
                 )
             )
 
+            # Signal local waiters that the record and audit trail are final;
+            # the event stays reachable only through waiters already holding it
+            completed_event = self.completed_events.pop(tracking_id, None)
+            if completed_event:
+                completed_event.set()
+
             # Notify source agent
-            await self.nats.publish(
+            await self.nats.publish_async(
                 f"mesh.agent.{invocation.source_agent_id}.notifications",
                 {
                     "type": "invocation_complete",
@@ -53,6 +53,8 @@ async def test_get_operations(postgres_adapter):
 
     # Check that expected operations are registered
     assert "sql_query" in operations
+    assert "sql_script" in operations
+    assert "copy" in operations
     assert "insert" in operations
     assert "update" in operations
     assert "delete" in operations
@@ -94,6 +96,79 @@ async def test_sql_query_basic(postgres_adapter):
     assert result.rows[0]["value"] == 1
 
 
+@pytest.mark.asyncio
+async def test_sql_script_operation(postgres_adapter):
+    """Test multi-statement script execution in one transaction."""
+    result = await postgres_adapter.execute(
+        "sql_script",
+        script="""
+        TRUNCATE test_users;
+        INSERT INTO test_users (username, email)
+        VALUES ('script1', 'script1@example.com'), ('script2', 'script2@example.com');
+        """,
+    )
+
+    assert result.success is True
+    assert result.status == "INSERT 0 2"
+
+    query_result = await postgres_adapter.execute(
+        "sql_query", query="SELECT username FROM test_users ORDER BY username"
+    )
+    assert [row["username"] for row in query_result.rows] == ["script1", "script2"]
+
+
+@pytest.mark.asyncio
+async def test_copy_operation(postgres_adapter):
+    """Test bulk loading rows with COPY."""
+    await postgres_adapter.execute("sql_script", script="TRUNCATE test_users")
+
+    result = await postgres_adapter.execute(
+        "copy",
+        table="test_users",
+        columns=["username", "email"],
+        rows=[["copy1", "copy1@example.com"], ["copy2", "copy2@example.com"]],
+    )
+
+    assert result.success is True
+    assert result.copied_count == 2
+
+    query_result = await postgres_adapter.execute(
+        "sql_query", query="SELECT username FROM test_users ORDER BY username"
+    )
+    assert [row["username"] for row in query_result.rows] == ["copy1", "copy2"]
+
+
+@pytest.mark.asyncio
+async def test_direct_execute(postgres_adapter):
+    """Test running SQL directly on the pool."""
+    status = await postgres_adapter._direct_execute(
+        "TRUNCATE test_users; "
+        "INSERT INTO test_users (username, email) VALUES ('direct', 'd@example.com')"
+    )
+    assert status == "INSERT 0 1"
+
+    result = await postgres_adapter.execute(
+        "sql_query", query="SELECT username FROM test_users"
+    )
+    assert [row["username"] for row in result.rows] == ["direct"]
+
+
+@pytest.mark.asyncio
+async def test_execute_many(postgres_adapter):
+    """Test batched parameterised inserts."""
+    await postgres_adapter.execute_many(
+        "INSERT INTO test_users (username, email) VALUES ($1, $2)",
+        [("many1", "many1@example.com"), ("many2", "many2@example.com")],
+    )
+
+    result = await postgres_adapter.execute(
+        "sql_query",
+        query="SELECT username FROM test_users WHERE username LIKE 'many%' "
+        "ORDER BY username",
+    )
+    assert [row["username"] for row in result.rows] == ["many1", "many2"]
+
+
 @pytest.mark.asyncio
 async def test_insert_operation(postgres_adapter):
     """Test insert operation."""
@@ -0,0 +1,87 @@
+"""
+Tests for the buffered audit writer.
+"""
+import pytest
+
+from adapters.persistence import AuditBuffer
+from adapters.persistence.schemas import (
+    AuditEvent,
+    AuditEventType,
+    AuditOutcome,
+    AuditQuery,
+)
+
+
+def _event(source_id: str) -> AuditEvent:
+    return AuditEvent(
+        event_type=AuditEventType.QUERY,
+        source_id=source_id,
+        target_id="kb-1",
+        outcome=AuditOutcome.SUCCESS,
+    )
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_queued_events(sqlite_adapter):
+    """Test that flush returns once every appended event is stored"""
+    buffer = AuditBuffer(sqlite_adapter)
+    await buffer.start()
+    try:
+        for i in range(5):
+            await buffer.append(_event(f"agent-{i}"))
+        await buffer.flush()
+
+        events = await sqlite_adapter.query_audit_logs(AuditQuery(limit=100))
+        assert len(events) == 5
+    finally:
+        await buffer.stop()
+
+
+@pytest.mark.asyncio
+async def test_flush_without_running_flusher(sqlite_adapter):
+    """Test that flush writes pending events itself when never started"""
+    buffer = AuditBuffer(sqlite_adapter, max_batch=2)
+    for i in range(3):
+        await buffer.append(_event(f"agent-{i}"))
+
+    await buffer.flush()
+
+    events = await sqlite_adapter.query_audit_logs(AuditQuery(limit=100))
+    assert len(events) == 3
+
+
+@pytest.mark.asyncio
+async def test_events_are_written_in_batches(sqlite_adapter):
+    """Test that queued events are coalesced up to max_batch per write"""
+    batch_sizes = []
+    write_bulk = sqlite_adapter.write_audit_logs_bulk
+
+    async def record_batch(events):
+        batch_sizes.append(len(events))
+        return await write_bulk(events)
+
+    sqlite_adapter.write_audit_logs_bulk = record_batch
+    buffer = AuditBuffer(sqlite_adapter, max_batch=4)
+
+    # Queue everything before the flusher runs so it sees a full backlog
+    for i in range(10):
+        await buffer.append(_event(f"agent-{i}"))
+    await buffer.start()
+    await buffer.flush()
+    await buffer.stop()
+
+    assert batch_sizes == [4, 4, 2]
+    events = await sqlite_adapter.query_audit_logs(AuditQuery(limit=100))
+    assert len(events) == 10
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_pending_events(sqlite_adapter):
+    """Test that stopping the buffer writes events still in the queue"""
+    buffer = AuditBuffer(sqlite_adapter)
+    await buffer.start()
+    await buffer.append(_event("agent-1"))
+    await buffer.stop()
+
+    events = await sqlite_adapter.query_audit_logs(AuditQuery(limit=100))
+    assert [e.source_id for e in events] == ["agent-1"]
@@ -1,7 +1,9 @@
 """
 Integration tests for SQLite persistence adapter.
 """
+import asyncio
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 
 import pytest
 
@@ -18,6 +20,7 @@ from adapters.persistence.schemas import (
     PolicyRule,
     RegistryQuery,
 )
+from adapters.persistence.sqlite import SQLitePersistenceAdapter
 
 # ============================================
 # HEALTH CHECK TESTS
@@ -154,12 +157,105 @@ async def test_list_agents_with_filters(sqlite_adapter):
     agents = await sqlite_adapter.list_agents(RegistryQuery(capabilities=["query_kb"]))
     assert len(agents) == 2
 
+    # Every requested capability must be present
+    agents = await sqlite_adapter.list_agents(
+        RegistryQuery(capabilities=["query_kb", "code_review", "query_kb"])
+    )
+    assert [agent.identity for agent in agents] == ["engineering-agent-1"]
+
     # Query by specific identity
     agents = await sqlite_adapter.list_agents(RegistryQuery(identity="sales-agent-1"))
     assert len(agents) == 1
     assert agents[0].identity == "sales-agent-1"
 
 
+@pytest.mark.asyncio
+async def test_capability_filter_follows_updates(sqlite_adapter):
+    """Test capability filters track capability updates and deregistration"""
+    await sqlite_adapter.register_agent(
+        AgentRegistration(
+            identity="cap-agent",
+            version="1.0.0",
+            capabilities=["query_kb"],
+            operations=["query"],
+            schemas={},
+            health_endpoint="http://localhost:8000/health",
+            metadata={},
+        )
+    )
+
+    write_query = RegistryQuery(capabilities=["write_kb"])
+    assert await sqlite_adapter.list_agents(write_query) == []
+
+    await sqlite_adapter.update_agent_capabilities("cap-agent", ["write_kb"])
+    agents = await sqlite_adapter.list_agents(write_query)
+    assert [agent.identity for agent in agents] == ["cap-agent"]
+    assert (
+        await sqlite_adapter.list_agents(RegistryQuery(capabilities=["query_kb"])) == []
+    )
+
+    await sqlite_adapter.deregister_agent("cap-agent")
+    cursor = await sqlite_adapter.conn.execute(
+        "SELECT COUNT(*) FROM agent_capabilities WHERE identity = ?", ("cap-agent",)
+    )
+    assert (await cursor.fetchone())[0] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_agents(sqlite_adapter):
+    """Test fetching several agents by identity in one call"""
+    for identity in ("agent-a", "agent-b", "agent-c"):
+        await sqlite_adapter.register_agent(
+            AgentRegistration(
+                identity=identity,
+                version="1.0.0",
+                capabilities=["test"],
+                operations=["query"],
+                schemas={},
+                health_endpoint="http://localhost:8000/health",
+                metadata={},
+            )
+        )
+
+    agents = await sqlite_adapter.get_agents(["agent-a", "agent-c", "missing"])
+    assert sorted(agent.identity for agent in agents) == ["agent-a", "agent-c"]
+    assert await sqlite_adapter.get_agents([]) == []
+
+
+@pytest.mark.asyncio
+async def test_deregister_many(sqlite_adapter):
+    """Test removing several agents and KBs at once, skipping unknown ids"""
+    for identity in ("agent-a", "agent-b", "agent-c"):
+        await sqlite_adapter.register_agent(
+            AgentRegistration(
+                identity=identity,
+                version="1.0.0",
+                capabilities=["test"],
+                operations=["query"],
+                schemas={},
+                health_endpoint="http://localhost:8000/health",
+                metadata={},
+            )
+        )
+    await sqlite_adapter.register_kb(
+        KBRegistration(
+            kb_id="kb-a",
+            kb_type="postgres",
+            endpoint="postgresql://localhost:5432/test",
+            operations=["sql_query"],
+            kb_schema={},
+            metadata={},
+        )
+    )
+
+    await sqlite_adapter.deregister_many(["agent-a", "agent-b", "missing"], ["kb-a"])
+
+    assert await sqlite_adapter.get_agent("agent-a") is None
+    assert await sqlite_adapter.get_agent("agent-b") is None
+    assert await sqlite_adapter.get_agent("agent-c") is not None
+    assert await sqlite_adapter.get_kb("kb-a") is None
+
+
 @pytest.mark.asyncio
 async def test_deregister_agent(sqlite_adapter):
     """Test agent deregistration"""
@@ -656,6 +752,102 @@ async def test_log_and_query_audit_events(sqlite_adapter):
     assert len(denied_events) == 1
     assert denied_events[0].source_id == "marketing-agent-1"
 
+    # Query by several sources at once
+    multi_source_events = await sqlite_adapter.query_audit_logs(
+        AuditQuery(source_ids=["sales-agent-1", "marketing-agent-1"])
+    )
+    assert len(multi_source_events) == 3
+
+    multi_source_denied = await sqlite_adapter.query_audit_logs(
+        AuditQuery(
+            source_ids=["sales-agent-1", "marketing-agent-1"],
+            outcome=AuditOutcome.DENIED,
+        )
+    )
+    assert [e.source_id for e in multi_source_denied] == ["marketing-agent-1"]
+
+
+@pytest.mark.asyncio
+async def test_query_audit_logs_prepared(sqlite_adapter):
+    """Test equality-filtered audit queries through the keyword shorthand"""
+    for source_id, outcome in [
+        ("sales-agent-1", AuditOutcome.SUCCESS),
+        ("marketing-agent-1", AuditOutcome.DENIED),
+        ("marketing-agent-1", AuditOutcome.SUCCESS),
+    ]:
+        await sqlite_adapter.log_event(
+            AuditEvent(
+                event_type=AuditEventType.QUERY,
+                source_id=source_id,
+                target_id="sales-kb-1",
+                outcome=outcome,
+            )
+        )
+
+    events = await sqlite_adapter.query_audit_logs_prepared(
+        event_type=AuditEventType.QUERY,
+        source_id="marketing-agent-1",
+        target_id="sales-kb-1",
+        limit=5,
+    )
+    assert len(events) == 2
+    assert all(e.source_id == "marketing-agent-1" for e in events)
+
+    events = await sqlite_adapter.query_audit_logs_prepared(
+        event_type=AuditEventType.QUERY,
+        source_id="sales-agent-1",
+        target_id="sales-kb-1",
+    )
+    assert [e.outcome for e in events] == [AuditOutcome.SUCCESS]
+
+    assert len(await sqlite_adapter.query_audit_logs_prepared(limit=2)) == 2
+
+    # An empty id is still a filter, not "any source"
+    assert await sqlite_adapter.query_audit_logs_prepared(source_id="") == []
+
+
+@pytest.mark.asyncio
+async def test_write_audit_logs_bulk(sqlite_adapter):
+    """Test writing a batch of audit events in one call"""
+    event_ids = await sqlite_adapter.write_audit_logs_bulk(
+        [
+            AuditEvent(
+                event_type=AuditEventType.QUERY,
+                source_id=f"agent-{i}",
+                target_id="kb-1",
+                outcome=AuditOutcome.SUCCESS,
+                masked_fields=["email"],
+            )
+            for i in range(3)
+        ]
+    )
+    assert len(set(event_ids)) == 3
+
+    events = await sqlite_adapter.query_audit_logs(AuditQuery(limit=100))
+    assert {e.id for e in events} == set(event_ids)
+    assert all(e.masked_fields == ["email"] for e in events)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_audit_writes(sqlite_adapter):
+    """Test that concurrent writers on one adapter all commit"""
+    await asyncio.gather(
+        *(
+            sqlite_adapter.log_event(
+                AuditEvent(
+                    event_type=AuditEventType.QUERY,
+                    source_id=f"agent-{i}",
+                    target_id="kb-1",
+                    outcome=AuditOutcome.SUCCESS,
+                )
+            )
+            for i in range(20)
+        )
+    )
+
+    events = await sqlite_adapter.query_audit_logs(AuditQuery(limit=100))
+    assert len(events) == 20
+
 
 @pytest.mark.asyncio
 async def test_audit_event_with_full_payload(sqlite_adapter):
@@ -727,6 +919,57 @@ async def test_audit_query_with_time_filters(sqlite_adapter):
     assert len(all_events) == 2
 
 
+@pytest.mark.asyncio
+async def test_audit_query_default_time_window(sqlite_adapter):
+    """Test that queries without start_time only cover the default window"""
+    now = datetime.now(UTC)
+    for age in (timedelta(days=40), timedelta(hours=1)):
+        await sqlite_adapter.log_event(
+            AuditEvent(
+                event_type=AuditEventType.QUERY,
+                source_id="agent-1",
+                target_id="kb-1",
+                outcome=AuditOutcome.SUCCESS,
+                timestamp=now - age,
+            )
+        )
+
+    events = await sqlite_adapter.query_audit_logs(AuditQuery(target_id="kb-1"))
+    assert len(events) == 1
+
+    # The keyword shorthand applies the same window
+    events = await sqlite_adapter.query_audit_logs_prepared(target_id="kb-1")
+    assert len(events) == 1
+
+    # An explicit start_time still reaches older events
+    events = await sqlite_adapter.query_audit_logs(
+        AuditQuery(target_id="kb-1", start_time=now - timedelta(days=60))
+    )
+    assert len(events) == 2
+
+
+@pytest.mark.asyncio
+async def test_iter_audit_logs(sqlite_adapter):
+    """Test streaming audit logs matches the list query"""
+    await sqlite_adapter.write_audit_logs_bulk(
+        [
+            AuditEvent(
+                event_type=AuditEventType.QUERY,
+                source_id=f"agent-{i}",
+                target_id="kb-1",
+                outcome=AuditOutcome.SUCCESS,
+            )
+            for i in range(150)
+        ]
+    )
+
+    query = AuditQuery(target_id="kb-1", limit=120)
+    streamed = [record async for record in sqlite_adapter.iter_audit_logs(query)]
+    listed = await sqlite_adapter.query_audit_logs(query)
+    assert [r.id for r in streamed] == [r.id for r in listed]
+    assert len(streamed) == 120
+
+
 @pytest.mark.asyncio
 async def test_get_audit_stats(sqlite_adapter):
     """Test getting audit statistics"""
@@ -776,6 +1019,50 @@ async def test_get_audit_stats(sqlite_adapter):
 # ============================================
 
 
+@pytest.mark.asyncio
+async def test_shared_cache_memory_uri(tmp_path):
+    """Test that adapters on the same shared-cache URI see the same data"""
+    config_path = tmp_path / "test_config.yaml"
+    config_path.write_text(
+        """
+adapter:
+  type: "sqlite"
+  version: "1.0.0"
+
+database:
+  path: "file:agentmesh_shared_test?mode=memory&cache=shared"
+  journal_mode: "MEMORY"
+  synchronous: "OFF"
+"""
+    )
+
+    writer = SQLitePersistenceAdapter(str(config_path))
+    reader = SQLitePersistenceAdapter(str(config_path))
+    await writer.connect()
+    await reader.connect()
+    try:
+        await writer.register_agent(
+            AgentRegistration(
+                identity="shared-agent",
+                version="1.0.0",
+                capabilities=["test"],
+                operations=["query"],
+                schemas={},
+                health_endpoint="http://localhost:8000/health",
+                metadata={},
+            )
+        )
+        agent = await reader.get_agent("shared-agent")
+        assert agent is not None
+        assert agent.identity == "shared-agent"
+    finally:
+        await reader.disconnect()
+        await writer.disconnect()
+
+    # Nothing is written to disk for an in-memory URI
+    assert not Path("file:agentmesh_shared_test?mode=memory&cache=shared").exists()
+
+
 @pytest.mark.asyncio
 async def test_file_based_persistence(file_based_sqlite_adapter):
     """Test that data persists to file"""
@@ -798,3 +1085,52 @@ async def test_file_based_persistence(file_based_sqlite_adapter):
     agent = await adapter.get_agent("persistent-agent")
     assert agent is not None
     assert agent.identity == "persistent-agent"
+
+
+@pytest.mark.asyncio
+async def test_pragmas_from_config(tmp_path):
+    """Test that connection pragmas are applied from config"""
+    config_path = tmp_path / "test_config.yaml"
+    config_path.write_text(
+        f"""
+adapter:
+  type: "sqlite"
+  version: "1.0.0"
+
+database:
+  path: "{tmp_path / 'pragmas.db'}"
+  cache_size: -4096
+  mmap_size: 1048576
+"""
+    )
+
+    adapter = SQLitePersistenceAdapter(str(config_path))
+    await adapter.connect()
+    try:
+        cursor = await adapter.conn.execute("PRAGMA cache_size")
+        assert (await cursor.fetchone())[0] == -4096
+        cursor = await adapter.conn.execute("PRAGMA mmap_size")
+        assert (await cursor.fetchone())[0] == 1048576
+        cursor = await adapter.conn.execute("PRAGMA journal_mode")
+        assert (await cursor.fetchone())[0] == "wal"
+        # Migrations run with FULL, steady state drops back to NORMAL
+        cursor = await adapter.conn.execute("PRAGMA synchronous")
+        assert (await cursor.fetchone())[0] == 1
+    finally:
+        await adapter.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_audit_query_uses_entity_time_index(sqlite_adapter):
+    """Test that target/source audit filters seek the composite time indexes"""
+    for column, index in (
+        ("target_id", "idx_audit_target_ts"),
+        ("source_id", "idx_audit_source_ts"),
+    ):
+        cursor = await sqlite_adapter.conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT * FROM audit_logs WHERE {column} = ? "
+            "AND timestamp >= ? ORDER BY timestamp DESC LIMIT 100",
+            ("kb-1", datetime.now(UTC).isoformat()),
+        )
+        plan = " ".join(row["detail"] for row in await cursor.fetchall())
+        assert f"USING INDEX {index}" in plan
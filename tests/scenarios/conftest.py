@@ -0,0 +1,82 @@
+"""Shared fixtures for the end-to-end scenario tests."""
+
+import asyncio
+
+import nats
+import pytest
+import pytest_asyncio
+
+from adapters.knowledge_base.neo4j.adapter import Neo4jAdapter
+from adapters.knowledge_base.postgres.adapter import PostgresAdapter
+
+_MESH_NATS_URL = "nats://localhost:4222"
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run scenarios on uvloop when it is installed.
+
+    Every scenario is dominated by NATS/SQLite/OPA round trips, where libuv's
+    readiness notification has noticeably less per-await overhead than the
+    selector-based default loop. Falls back to the stock policy otherwise.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+async def _probe_mesh() -> None:
+    """Fail fast unless NATS is up and a mesh service answers on it."""
+    nc = await nats.connect(_MESH_NATS_URL, connect_timeout=0.5, allow_reconnect=False)
+    try:
+        await nc.request(
+            "mesh.directory.query", b'{"type": "agents", "limit": 1}', timeout=1.0
+        )
+    finally:
+        await nc.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mesh_up():
+    """Probe the externally running mesh once per session.
+
+    Tests that need a live mesh depend on this instead of each handling its
+    own connect-timeout-then-skip path; when the mesh is down every such test
+    skips after a single probe.
+    """
+    try:
+        await _probe_mesh()
+    except Exception as e:
+        pytest.skip(
+            f"Mesh not reachable at {_MESH_NATS_URL} - is it running? Error: {e!r}"
+        )
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def postgres_pool():
+    """One asyncpg pool for every scenario that hands it to a PostgresAdapter.
+
+    Skips the dependent tests when PostgreSQL is not reachable.
+    """
+    owner = PostgresAdapter("adapters/knowledge_base/postgres/config.yaml")
+    try:
+        await owner.connect()
+    except Exception as e:
+        pytest.skip(f"PostgreSQL not available: {e!r}")
+    yield owner.pool
+    await owner.disconnect()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def neo4j_driver():
+    """One Neo4j driver, and with it one Bolt connection pool, per session.
+
+    The driver connects lazily, so this never fails on its own; a missing
+    server surfaces on the first query.
+    """
+    owner = Neo4jAdapter("adapters/knowledge_base/neo4j/config.yaml")
+    await owner.connect()
+    yield owner.driver
+    await owner.disconnect()
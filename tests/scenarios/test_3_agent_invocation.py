@@ -8,12 +8,22 @@ Tests scenarios:
 
 import asyncio
 import json
+import os
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
+from pathlib import Path
 
 import pytest
+from nats.aio.msg import Msg
 
 from adapters.messaging.nats_client import NATSWrapper
-from adapters.persistence.schemas import AuditEventType, AuditOutcome, AuditQuery
+from adapters.persistence.schemas import (
+    AuditEventType,
+    AuditOutcome,
+    AuditQuery,
+    AuditRecord,
+)
 from adapters.persistence.sqlite.adapter import SQLitePersistenceAdapter
 from adapters.policy.opa_client import OPAClient
 from services.enforcement import EnforcementService
@@ -21,16 +31,136 @@ from services.registry import AgentService
 from services.registry.schemas import AgentRegistrationRequest
 from services.routing import AgentInvokeRequest, InvocationStatus, RequestRouter
 
+# Namespace entities per xdist worker so scenarios can run in parallel
+# (``pytest -n 3``) without sharing NATS subjects or SQLite rows.
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+SALES_AGENT_ID = f"sales-agent-inv-{WORKER_ID}"
+ENG_AGENT_ID = f"engineering-agent-inv-{WORKER_ID}"
+MKT_AGENT_ID = f"marketing-agent-inv-{WORKER_ID}"
+
+SQLITE_CONFIG_TEMPLATE = """
+adapter:
+  type: "sqlite"
+  version: "1.0.0"
+
+database:
+  path: "{db_path}"
+  journal_mode: "WAL"
+  synchronous: "NORMAL"
+
+audit:
+  retention_days: 90
+  default_level: "lightweight"
+"""
+
+
+def _worker_sqlite_config(base_dir: Path) -> str:
+    """Write (once) a SQLite config pointing at this worker's own database file."""
+    config_path = base_dir / f"sqlite-{WORKER_ID}.yaml"
+    if not config_path.exists():
+        config_path.write_text(
+            SQLITE_CONFIG_TEMPLATE.format(db_path=base_dir / f"audit-{WORKER_ID}.db")
+        )
+    return str(config_path)
+
+
+# Every scenario's audit assertions are served from this single query shape;
+# repeated executions reuse SQLite's cached prepared statement.
+INVOCATION_AUDIT_QUERY = AuditQuery(
+    event_type=AuditEventType.INVOKE,
+    source_ids=[SALES_AGENT_ID, MKT_AGENT_ID],
+    target_id=ENG_AGENT_ID,
+    limit=20,
+)
+
+
+class NotificationBuffer:
+    """Single-producer/single-consumer notification buffer.
+
+    A deque plus an event is enough for one callback feeding one waiter and
+    avoids the lock/condition bookkeeping of ``asyncio.Queue``.
+    """
+
+    def __init__(self):
+        self._items: deque[dict] = deque()
+        self._ready = asyncio.Event()
+
+    def put(self, message: dict) -> None:
+        """Append a message and wake the consumer."""
+        self._items.append(message)
+        self._ready.set()
+
+    async def get(self) -> dict:
+        """Wait for and return the oldest buffered message."""
+        await self._ready.wait()
+        message = self._items.popleft()
+        if not self._items:
+            self._ready.clear()
+        return message
+
+
+# AgentService never mutates registration requests, so they are built (and
+# validated) once at import time and shared across scenarios.
+_SALES_REG = AgentRegistrationRequest(
+    identity=SALES_AGENT_ID,
+    version="1.0.0",
+    capabilities=["query_kb", "invoke_agent"],
+    operations=["query", "invoke"],
+    health_endpoint="http://localhost:8001/health",
+    metadata={"department": "sales", "team": "west-coast"},
+)
+
+_ENG_REG = AgentRegistrationRequest(
+    identity=ENG_AGENT_ID,
+    version="2.0.0",
+    capabilities=["prioritize_feature", "deploy"],
+    operations=["invoke", "execute"],
+    health_endpoint="http://localhost:8003/health",
+    metadata={"department": "engineering", "team": "platform"},
+)
+
+_SALES_INVOKER_REG = AgentRegistrationRequest(
+    identity=SALES_AGENT_ID,
+    version="1.0.0",
+    capabilities=["invoke_agent"],
+    operations=["invoke"],
+    health_endpoint="http://localhost:8001/health",
+)
+
+_ENG_EXECUTOR_REG = AgentRegistrationRequest(
+    identity=ENG_AGENT_ID,
+    version="2.0.0",
+    capabilities=["execute_task"],
+    operations=["execute"],
+    health_endpoint="http://localhost:8003/health",
+)
+
+_MKT_REG = AgentRegistrationRequest(
+    identity=MKT_AGENT_ID,
+    version="1.0.0",
+    capabilities=["analytics"],
+    operations=["query"],
+    health_endpoint="http://localhost:8002/health",
+)
+
+_ENG_DEPLOY_REG = AgentRegistrationRequest(
+    identity=ENG_AGENT_ID,
+    version="2.0.0",
+    capabilities=["deploy"],
+    operations=["execute"],
+    health_endpoint="http://localhost:8003/health",
+)
+
 
 class TestSection3AgentInvocation:
     """Test Agent-to-Agent Invocation scenarios"""
 
     @pytest.fixture(autouse=True)
-    async def setup(self):
+    async def setup(self, tmp_path_factory):
         """Setup test fixtures"""
-        # Initialize persistence adapter
+        # Initialize persistence adapter (one database file per xdist worker)
         self.persistence = SQLitePersistenceAdapter(
-            "adapters/persistence/sqlite/config.yaml"
+            _worker_sqlite_config(tmp_path_factory.getbasetemp())
         )
         await self.persistence.connect()
 
@@ -62,6 +192,7 @@ class TestSection3AgentInvocation:
             persistence=self.persistence,
             kb_adapters={},
             nats_client=self.nats_client,
+            denial_cache_ttl=60.0,
         )
 
         # Initialize request router
@@ -78,15 +209,26 @@ class TestSection3AgentInvocation:
         # Setup agent invocation policy
         await self._setup_invocation_policy()
 
-        # Track mock agent subscriptions for cleanup
-        self.mock_subscriptions = []
+        # One wildcard subscription per subject family; scenarios register
+        # per-agent handlers in these dicts instead of subscribing themselves
+        self._invoke_handlers: dict[str, Callable[[dict], Awaitable[None]]] = {}
+        self._notification_handlers: dict[str, Callable[[dict], Awaitable[None]]] = {}
+        self.mock_subscriptions = [
+            await self.nats_client.nc.subscribe(
+                "mesh.agent.*.invoke", cb=self._dispatch(self._invoke_handlers)
+            ),
+            await self.nats_client.nc.subscribe(
+                "mesh.agent.*.notifications",
+                cb=self._dispatch(self._notification_handlers),
+            ),
+        ]
 
         yield
 
         # Cleanup subscriptions
-        for sub_id in self.mock_subscriptions:
+        for sub in self.mock_subscriptions:
             try:
-                await self.nats_client.nc.unsubscribe(sub_id)
+                await sub.unsubscribe()
             except Exception:
                 pass
 
@@ -103,9 +245,9 @@ class TestSection3AgentInvocation:
     async def _cleanup_test_entities(self):
         """Clean up test entities that might exist from previous runs"""
         test_agents = [
-            "sales-agent-inv-1",
-            "engineering-agent-inv-1",
-            "marketing-agent-inv-1",
+            SALES_AGENT_ID,
+            ENG_AGENT_ID,
+            MKT_AGENT_ID,
         ]
 
         for agent_id in test_agents:
@@ -162,6 +304,38 @@ decision = result if {
         assert result.get("success") or "result" in result, "Policy upload should succeed"
         print("   ✓ Agent invocation policy uploaded")
 
+    @staticmethod
+    def _dispatch(handlers: dict[str, Callable[[dict], Awaitable[None]]]):
+        """
+        Build a wildcard subscription callback that routes by agent ID.
+
+        Args:
+            handlers: Mapping of agent ID to handler; looked up per message
+                from the ``mesh.agent.<agent_id>.<kind>`` subject
+        """
+        async def dispatch(msg: Msg):
+            handler = handlers.get(msg.subject.split(".")[2])
+            if handler:
+                await handler(json.loads(msg.data.decode()))
+
+        return dispatch
+
+    async def _invocation_audit_trail(self) -> dict[str, list[AuditRecord]]:
+        """
+        Fetch every invocation audit record for this worker's agents at once.
+
+        One ``source_id IN (...)`` query covers all scenarios' sources; the
+        rows are partitioned by source, newest first.
+
+        Returns:
+            Mapping of source agent ID to its invocation audit records
+        """
+        audit_logs = await self.persistence.query_audit_logs(INVOCATION_AUDIT_QUERY)
+        trail: dict[str, list[AuditRecord]] = defaultdict(list)
+        for log in audit_logs:
+            trail[log.source_id].append(log)
+        return trail
+
     async def _simulate_target_agent(
         self, agent_id: str, operation: str, response_data: dict, delay: float = 0.1
     ):
@@ -199,30 +373,31 @@ decision = result if {
             }
 
             print(f"   [Mock Agent {agent_id}] Sending completion notification")
-            await self.nats_client.publish("mesh.routing.completion", completion_msg)
+            await self.nats_client.publish_async("mesh.routing.completion", completion_msg)
 
-        # Subscribe to invocation subject for this agent
-        subject = f"mesh.agent.{agent_id}.invoke"
-        sub_id = await self.nats_client.subscribe(subject, handle_invoke)
-        self.mock_subscriptions.append(sub_id)
-        print(f"   ✓ Mock agent {agent_id} listening on {subject}")
+        # Route this agent's invocations to the handler
+        self._invoke_handlers[agent_id] = handle_invoke
+        print(f"   ✓ Mock agent {agent_id} listening on mesh.agent.{agent_id}.invoke")
 
-    async def _subscribe_to_notifications(self, agent_id: str, notification_queue: asyncio.Queue):
+    async def _subscribe_to_notifications(
+        self, agent_id: str, notification_queue: NotificationBuffer
+    ):
         """
         Subscribe to notifications for an agent.
         
         Args:
             agent_id: The agent ID to subscribe for
-            notification_queue: Queue to put received notifications
+            notification_queue: Buffer to put received notifications
         """
         async def handle_notification(message: dict):
             """Handle notification message"""
-            await notification_queue.put(message)
+            notification_queue.put(message)
 
-        subject = f"mesh.agent.{agent_id}.notifications"
-        sub_id = await self.nats_client.subscribe(subject, handle_notification)
-        self.mock_subscriptions.append(sub_id)
-        print(f"   ✓ Subscribed to notifications for {agent_id} on {subject}")
+        self._notification_handlers[agent_id] = handle_notification
+        print(
+            f"   ✓ Subscribed to notifications for {agent_id} "
+            f"on mesh.agent.{agent_id}.notifications"
+        )
 
     async def test_scenario_3_1_agent_invokes_another_agent(self):
         """
@@ -242,37 +417,19 @@ decision = result if {
         print("=" * 70)
 
         # Register source agent (Sales)
-        print("\n1. Registering source agent (sales-agent-inv-1)...")
-        await self.agent_service.register_agent(
-            AgentRegistrationRequest(
-                identity="sales-agent-inv-1",
-                version="1.0.0",
-                capabilities=["query_kb", "invoke_agent"],
-                operations=["query", "invoke"],
-                health_endpoint="http://localhost:8001/health",
-                metadata={"department": "sales", "team": "west-coast"},
-            )
-        )
-        print("   ✓ sales-agent-inv-1 registered")
+        print(f"\n1. Registering source agent ({SALES_AGENT_ID})...")
+        await self.agent_service.register_agent(_SALES_REG)
+        print(f"   ✓ {SALES_AGENT_ID} registered")
 
         # Register target agent (Engineering)
-        print("\n2. Registering target agent (engineering-agent-inv-1)...")
-        await self.agent_service.register_agent(
-            AgentRegistrationRequest(
-                identity="engineering-agent-inv-1",
-                version="2.0.0",
-                capabilities=["prioritize_feature", "deploy"],
-                operations=["invoke", "execute"],
-                health_endpoint="http://localhost:8003/health",
-                metadata={"department": "engineering", "team": "platform"},
-            )
-        )
-        print("   ✓ engineering-agent-inv-1 registered")
+        print(f"\n2. Registering target agent ({ENG_AGENT_ID})...")
+        await self.agent_service.register_agent(_ENG_REG)
+        print(f"   ✓ {ENG_AGENT_ID} registered")
 
         # Setup mock target agent to respond
         print("\n3. Setting up mock target agent to handle invocation...")
         await self._simulate_target_agent(
-            agent_id="engineering-agent-inv-1",
+            agent_id=ENG_AGENT_ID,
             operation="prioritize_feature",
             response_data={
                 "priority": "P0",
@@ -284,14 +441,14 @@ decision = result if {
         )
 
         # Setup notification listener for source agent
-        notification_queue = asyncio.Queue()
-        await self._subscribe_to_notifications("sales-agent-inv-1", notification_queue)
+        notification_queue = NotificationBuffer()
+        await self._subscribe_to_notifications(SALES_AGENT_ID, notification_queue)
 
         # ✓ Policy check: Can Sales invoke Engineering?
         print("\n4. Initiating agent invocation request...")
         invoke_request = AgentInvokeRequest(
-            source_agent_id="sales-agent-inv-1",
-            target_agent_id="engineering-agent-inv-1",
+            source_agent_id=SALES_AGENT_ID,
+            target_agent_id=ENG_AGENT_ID,
             operation="prioritize_feature",
             payload={
                 "feature": "Multi-tenant support",
@@ -337,6 +494,7 @@ decision = result if {
         try:
             # Wait for notification with timeout
             notification = await asyncio.wait_for(notification_queue.get(), timeout=2.0)
+            await self.nats_client.flush(timeout=2.0)
             
             print(f"   ✓ Completion notification received:")
             print(f"     - Type: {notification.get('type')}")
@@ -352,8 +510,10 @@ decision = result if {
         except asyncio.TimeoutError:
             pytest.fail("Did not receive completion notification within timeout")
 
-        # Give mesh a moment to update invocation record
-        await asyncio.sleep(0.1)
+        # Wait for mesh to finalize the invocation record
+        await asyncio.wait_for(
+            self.request_router.wait_completed(response.tracking_id), timeout=2.0
+        )
 
         # Check invocation status
         print("\n7. Verifying invocation status in mesh...")
@@ -374,13 +534,7 @@ decision = result if {
 
         # ✓ Audit log records full invocation chain
         print("\n8. Verifying audit trail...")
-        audit_query = AuditQuery(
-            event_type=AuditEventType.INVOKE,
-            source_id="sales-agent-inv-1",
-            target_id="engineering-agent-inv-1",
-            limit=5,
-        )
-        audit_logs = await self.persistence.query_audit_logs(audit_query)
+        audit_logs = (await self._invocation_audit_trail())[SALES_AGENT_ID]
 
         if len(audit_logs) > 0:
             invocation_log = audit_logs[0]
@@ -393,8 +547,8 @@ decision = result if {
             
             # Verify audit log details
             assert invocation_log.event_type == AuditEventType.INVOKE
-            assert invocation_log.source_id == "sales-agent-inv-1"
-            assert invocation_log.target_id == "engineering-agent-inv-1"
+            assert invocation_log.source_id == SALES_AGENT_ID
+            assert invocation_log.target_id == ENG_AGENT_ID
             assert invocation_log.outcome == AuditOutcome.SUCCESS
 
             # Check for tracking ID in metadata
@@ -428,28 +582,13 @@ decision = result if {
 
         # Register agents
         print("\n1. Registering test agents...")
-        await self.agent_service.register_agent(
-            AgentRegistrationRequest(
-                identity="sales-agent-inv-1",
-                version="1.0.0",
-                capabilities=["invoke_agent"],
-                operations=["invoke"],
-                health_endpoint="http://localhost:8001/health",
-            )
-        )
-        await self.agent_service.register_agent(
-            AgentRegistrationRequest(
-                identity="engineering-agent-inv-1",
-                version="2.0.0",
-                capabilities=["execute_task"],
-                operations=["execute"],
-                health_endpoint="http://localhost:8003/health",
-            )
-        )
+        await self.agent_service.register_agent(_SALES_INVOKER_REG)
+        await self.agent_service.register_agent(_ENG_EXECUTOR_REG)
         print("   ✓ Agents registered")
 
         # Setup mock target agent with custom result
         print("\n2. Setting up mock target agent...")
+        completion_iso = datetime.now(UTC).isoformat()
         custom_result = {
             "task_id": "TASK-1234",
             "status": "completed",
@@ -459,24 +598,24 @@ decision = result if {
                 "coverage": "95%",
                 "deployed_to": "staging",
             },
-            "completion_time": datetime.now(UTC).isoformat(),
+            "completion_time": completion_iso,
         }
         await self._simulate_target_agent(
-            agent_id="engineering-agent-inv-1",
+            agent_id=ENG_AGENT_ID,
             operation="execute_task",
             response_data=custom_result,
             delay=0.15,
         )
 
         # Setup notification listener
-        notification_queue = asyncio.Queue()
-        await self._subscribe_to_notifications("sales-agent-inv-1", notification_queue)
+        notification_queue = NotificationBuffer()
+        await self._subscribe_to_notifications(SALES_AGENT_ID, notification_queue)
 
         # Initiate invocation
         print("\n3. Initiating invocation request...")
         invoke_request = AgentInvokeRequest(
-            source_agent_id="sales-agent-inv-1",
-            target_agent_id="engineering-agent-inv-1",
+            source_agent_id=SALES_AGENT_ID,
+            target_agent_id=ENG_AGENT_ID,
             operation="execute_task",
             payload={
                 "task": "Implement API rate limiting",
@@ -496,6 +635,7 @@ decision = result if {
         print("\n4. Waiting for completion notification...")
         try:
             notification = await asyncio.wait_for(notification_queue.get(), timeout=2.0)
+            await self.nats_client.flush(timeout=2.0)
             
             print(f"   ✓ Notification received by source agent:")
             print(f"     - Type: {notification.get('type')}")
@@ -515,8 +655,10 @@ decision = result if {
         except asyncio.TimeoutError:
             pytest.fail("Did not receive completion notification within timeout")
 
-        # Give mesh time to update
-        await asyncio.sleep(0.1)
+        # Wait for mesh to finalize the invocation record
+        await asyncio.wait_for(
+            self.request_router.wait_completed(tracking_id), timeout=2.0
+        )
 
         # ✓ Mesh logs completion timestamp
         print("\n5. Verifying completion timestamp in mesh...")
@@ -538,14 +680,11 @@ decision = result if {
 
         # ✓ Audit log updated with outcome
         print("\n6. Verifying audit log with completion outcome...")
-        audit_query = AuditQuery(
-            event_type=AuditEventType.INVOKE,
-            source_id="sales-agent-inv-1",
-            target_id="engineering-agent-inv-1",
-            outcome=AuditOutcome.SUCCESS,
-            limit=5,
-        )
-        audit_logs = await self.persistence.query_audit_logs(audit_query)
+        audit_logs = [
+            log
+            for log in (await self._invocation_audit_trail())[SALES_AGENT_ID]
+            if log.outcome == AuditOutcome.SUCCESS
+        ]
 
         if len(audit_logs) > 0:
             completion_log = audit_logs[0]
@@ -583,7 +722,7 @@ decision = result if {
         print("✅ SCENARIO 3.2 PASSED: Agent result handling successful")
         print("=" * 70)
 
-    async def test_scenario_3_3_invocation_denied_by_policy(self):
+    async def test_scenario_3_3_invocation_denied_by_policy(self, monkeypatch):
         """
         Additional Test: Invocation Denied by Policy
 
@@ -600,24 +739,8 @@ decision = result if {
 
         # Register agents
         print("\n1. Registering test agents...")
-        await self.agent_service.register_agent(
-            AgentRegistrationRequest(
-                identity="marketing-agent-inv-1",
-                version="1.0.0",
-                capabilities=["analytics"],
-                operations=["query"],
-                health_endpoint="http://localhost:8002/health",
-            )
-        )
-        await self.agent_service.register_agent(
-            AgentRegistrationRequest(
-                identity="engineering-agent-inv-1",
-                version="2.0.0",
-                capabilities=["deploy"],
-                operations=["execute"],
-                health_endpoint="http://localhost:8003/health",
-            )
-        )
+        await self.agent_service.register_agent(_MKT_REG)
+        await self.agent_service.register_agent(_ENG_DEPLOY_REG)
         print("   ✓ Agents registered")
 
         # Attempt unauthorized invocation
@@ -625,8 +748,8 @@ decision = result if {
         print("   Marketing agent trying to invoke Engineering agent...")
         
         invoke_request = AgentInvokeRequest(
-            source_agent_id="marketing-agent-inv-1",
-            target_agent_id="engineering-agent-inv-1",
+            source_agent_id=MKT_AGENT_ID,
+            target_agent_id=ENG_AGENT_ID,
             operation="deploy_to_production",
             payload={"service": "critical-api", "environment": "production"},
         )
@@ -650,13 +773,11 @@ decision = result if {
 
         # ✓ Audit log records denial
         print("\n3. Verifying denial in audit log...")
-        audit_query = AuditQuery(
-            source_id="marketing-agent-inv-1",
-            target_id="engineering-agent-inv-1",
-            outcome=AuditOutcome.DENIED,
-            limit=5,
-        )
-        audit_logs = await self.persistence.query_audit_logs(audit_query)
+        audit_logs = [
+            log
+            for log in (await self._invocation_audit_trail())[MKT_AGENT_ID]
+            if log.outcome == AuditOutcome.DENIED
+        ]
 
         if len(audit_logs) > 0:
             denial_log = audit_logs[0]
@@ -669,6 +790,24 @@ decision = result if {
         else:
             print(f"   ℹ️  No denial audit logs found yet (may be async)")
 
+        # ✓ Repeat attempt is denied from the cached decision
+        print("\n4. Retrying unauthorized invocation...")
+        opa_calls = []
+        evaluate_policy = self.opa_client.evaluate_policy
+
+        async def counting_evaluate_policy(**kwargs):
+            opa_calls.append(kwargs)
+            return await evaluate_policy(**kwargs)
+
+        monkeypatch.setattr(
+            self.opa_client, "evaluate_policy", counting_evaluate_policy
+        )
+        retry = await self.request_router.route_agent_invoke(invoke_request)
+        assert retry.status == InvocationStatus.DENIED
+        assert retry.tracking_id == ""
+        assert opa_calls == [], "Retry should be served from the cached denial"
+        print(f"   ✓ Retry denied without re-evaluating policy")
+
         print("\n" + "=" * 70)
         print("✅ ADDITIONAL TEST PASSED: Unauthorized invocation correctly denied")
         print("=" * 70)
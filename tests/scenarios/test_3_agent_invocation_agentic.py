@@ -9,50 +9,303 @@ This test follows the AGENTIC principle:
 
 Tests scenarios:
 - 3.1: Agent Invokes Another Agent
+- 3.2: Agent Discovers Target Before Invocation
+
+The scenarios are independent and can run in parallel: pytest -n 2 --dist=load
 """
 
 import asyncio
-import json
+import itertools
 import logging
+import os
 import time
+import uuid
+from collections.abc import Callable
 
+import nats
+import orjson
 import pytest
+import pytest_asyncio
 
 from dummy_agents.simple_nats_agent import SimpleNATSAgent
 
-logging.basicConfig(level=logging.INFO)
+# Quiet by default; opt into payload dumps with --log-cli-level=INFO
+logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
+# Both scenarios share one (uvloop, see conftest) event loop for the session
+# instead of building and tearing down a loop per test.
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# Unique per run and per test, so back-to-back or parallel runs never reuse
+# an identity (a wall-clock second did)
+_RUN_NONCE = uuid.uuid4().hex[:8]
+_SEQ = itertools.count()
+
+# Simulated agent work in seconds; zero by default so local runs pay no idle
+# time. Benchmarks set e.g. MESH_TEST_SIM_WORK=0.2, which also restores the
+# longer timeouts suited to a remote or loaded mesh.
+_SIM_WORK = float(os.environ.get("MESH_TEST_SIM_WORK", "0"))
+_INVOKE_TIMEOUT = 10.0 if _SIM_WORK else 2.0
+_WAIT_TIMEOUT = 5.0 if _SIM_WORK else 2.0
+
+
+def _pp(obj) -> str:
+    """Pretty-print a payload for verbose logging."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
+def _unique_suffix() -> str:
+    """Return an identity suffix unique to this run and call."""
+    return f"{_RUN_NONCE}-{next(_SEQ)}"
+
+
+def _future_for(pending: dict[str, asyncio.Future], tracking_id: str) -> asyncio.Future:
+    """
+    Return the future for a tracking ID, creating it on first use.
+
+    The mesh assigns tracking IDs, so a message can arrive before the test
+    knows which ID to wait on; whichever side asks first creates the future.
+    """
+    return pending.setdefault(tracking_id, asyncio.get_running_loop().create_future())
+
+
+def _resolve(pending: dict[str, asyncio.Future], msg: dict) -> None:
+    """Resolve the future matching a message's tracking ID."""
+    fut = _future_for(pending, msg["tracking_id"])
+    if not fut.done():
+        fut.set_result(msg)
+
+
+def _prioritization_result(invocation_msg: dict) -> dict:
+    """Engineering agent's answer to a feature prioritization request."""
+    return {
+        "priority": "P0",
+        "sprint": "Sprint-42",
+        "estimated_effort": "5 days",
+        "assigned_to": "engineering-team-alpha",
+        "feature": invocation_msg.get("payload", {}).get("feature"),
+    }
+
+
+def _feedback_result(invocation_msg: dict) -> dict:
+    """Support agent's answer to a customer feedback request."""
+    return {"feedback_summary": "Feature X highly requested"}
+
+
+class _InvocationHandler:
+    """
+    Target-agent side of an invocation.
+
+    This is what a real agent would do:
+    1. Receive invocation message
+    2. Process the request
+    3. Send completion notification back to mesh
+
+    A plain object rather than a per-test closure, so repeated runs
+    (``pytest --count``) do not keep each test's locals alive.
+    """
+
+    def __init__(
+        self,
+        agent: SimpleNATSAgent,
+        label: str,
+        result_for: Callable[[dict], dict],
+        pending: dict[str, asyncio.Future] | None = None,
+        verbose: bool = False,
+    ):
+        """
+        Args:
+            agent: Agent that sends the completion
+            label: Name used in progress output
+            result_for: Builds the completion result from the invocation
+            pending: Futures resolved once the completion is sent
+            verbose: Log the invocation payload
+        """
+        self.agent = agent
+        self.label = label
+        self.result_for = result_for
+        self.pending = pending
+        self.verbose = verbose
+        # perf_counter_ns() at arrival, per tracking ID
+        self.received_ns: dict[str, int] = {}
+
+    async def __call__(self, invocation_msg: dict) -> None:
+        tracking_id = invocation_msg.get("tracking_id")
+        self.received_ns[tracking_id] = time.perf_counter_ns()
+        print(f"\n   [{self.label}] 📥 Received invocation!")
+        print(f"     - Tracking ID: {tracking_id}")
+        print(f"     - From: {invocation_msg.get('source')}")
+        print(f"     - Operation: {invocation_msg.get('operation')}")
+        if self.verbose:
+            logger.info("Invocation payload: %s", _pp(invocation_msg.get("payload")))
+
+        # Simulate processing work
+        if _SIM_WORK:
+            await asyncio.sleep(_SIM_WORK)
+
+        # Send completion back to mesh via NATS
+        print(f"\n   [{self.label}] 📤 Sending completion...")
+        await self.agent.send_completion(
+            tracking_id=tracking_id,
+            status="complete",
+            result=self.result_for(invocation_msg),
+        )
+        print(f"     ✓ Completion sent for {tracking_id}")
+        if self.pending is not None:
+            _resolve(self.pending, invocation_msg)
+
+
+class _NotificationHandler:
+    """
+    Source-agent side of an invocation: resolves completion notifications.
+
+    This is how source agents know when invocations complete.
+    """
+
+    def __init__(
+        self,
+        label: str,
+        pending: dict[str, asyncio.Future],
+        verbose: bool = False,
+    ):
+        """
+        Args:
+            label: Name used in progress output
+            pending: Futures resolved per notification tracking ID
+            verbose: Log the notification result
+        """
+        self.label = label
+        self.pending = pending
+        self.verbose = verbose
+        # perf_counter_ns() at arrival, per tracking ID
+        self.received_ns: dict[str, int] = {}
+
+    async def __call__(self, notification_msg: dict) -> None:
+        self.received_ns[notification_msg.get("tracking_id")] = time.perf_counter_ns()
+        print(f"\n   [{self.label}] 📥 Received notification!")
+        print(f"     - Type: {notification_msg.get('type')}")
+        print(f"     - Tracking ID: {notification_msg.get('tracking_id')}")
+        print(f"     - Status: {notification_msg.get('status')}")
+        if self.verbose and notification_msg.get("result"):
+            logger.info("Notification result: %s", _pp(notification_msg.get("result")))
+
+        _resolve(self.pending, notification_msg)
+
+
+async def _bring_up(
+    make_agent, **registration
+) -> tuple[SimpleNATSAgent, dict]:
+    """
+    Create an agent on the shared connection and register it with the mesh.
+
+    Args:
+        make_agent: Agent factory fixture
+        **registration: Keyword arguments for ``register_with_mesh``
+
+    Returns:
+        Tuple of (agent, registration response)
+    """
+    agent = make_agent()
+    return agent, await agent.register_with_mesh(**registration)
+
+
+async def _discover_until_present(
+    agent: SimpleNATSAgent,
+    identity: str,
+    capability_filter: str | None = None,
+    attempts: int = 20,
+) -> dict:
+    """
+    Poll the directory with exponential backoff until an identity appears.
+
+    Returns as soon as the directory lists ``identity`` instead of waiting a
+    fixed settling period; gives up after ``attempts`` queries.
+
+    Returns:
+        The last discovery response
+    """
+    delay = 0.01
+    for _ in range(attempts):
+        result = await agent.discover_agents(capability_filter=capability_filter)
+        if any(a.get("identity") == identity for a in result.get("agents", [])):
+            return result
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.2)
+    return result
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def nats_conn(mesh_up):
+    """One NATS connection shared by every agent in the session."""
+    nc = await nats.connect("nats://localhost:4222")
+    yield nc
+    await nc.close()
+
+
+# Agents handed out per test; two per scenario, so four covers the suite
+_POOL_SIZE = 4
+
+
+async def _make_ready_agent(nc) -> SimpleNATSAgent:
+    """Create an agent on the shared connection, ready to register."""
+    agent = SimpleNATSAgent(nc=nc)
+    await agent.connect_to_mesh()
+    return agent
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def agent_pool(nats_conn):
+    """
+    Session pool of ready agents, built in one parallel burst.
+
+    Tests re-register pooled agents under fresh identities and return them
+    when done, so agent setup is paid once per session rather than per test.
+    """
+    pool = list(
+        await asyncio.gather(*(_make_ready_agent(nats_conn) for _ in range(_POOL_SIZE)))
+    )
+    yield pool
+    await asyncio.gather(*(agent.disconnect() for agent in pool))
+
 
 class TestSection3AgentInvocationAgentic:
     """AGENTIC Test: Agent-to-Agent Invocation (Zero Mesh Knowledge)"""
 
-    @pytest.fixture(autouse=True)
-    async def setup(self):
+    @pytest_asyncio.fixture(loop_scope="session")
+    async def make_agent(self, nats_conn, agent_pool):
         """
-        Setup test fixtures.
-        
+        Factory handing out pooled agents, owned by a single test.
+
+        Agents live in a per-test list rather than on the class instance, so
+        the scenarios share no mutable state and can be split across xdist
+        workers (``pytest -n 2 --dist=load``). The pool grows on demand if a
+        test needs more agents than it holds.
+
         NOTE: This assumes the mesh service is already running externally
         (via docker-compose or services/bootstrap/mesh_service.py)
         """
-        # Test agent instances (will be initialized in tests)
-        self.agents = []
-        
-        yield
-        
-        # Cleanup: disconnect all agents
-        for agent in self.agents:
+        agents: list[SimpleNATSAgent] = []
+
+        def factory() -> SimpleNATSAgent:
+            agent = agent_pool.pop() if agent_pool else SimpleNATSAgent(nc=nats_conn)
+            agents.append(agent)
+            return agent
+
+        yield factory
+
+        # Cleanup: drop agent subscriptions and return agents to the pool
+        # (the shared connection stays open)
+        for agent in agents:
             try:
                 await agent.disconnect()
             except Exception as e:
                 logger.warning(f"Error disconnecting agent: {e}")
+            agent_pool.append(agent)
 
-    def _track_agent(self, agent: SimpleNATSAgent):
-        """Track agent for cleanup"""
-        self.agents.append(agent)
-        return agent
-
-    async def test_scenario_3_1_agent_invokes_another_agent_agentic(self):
+    async def test_scenario_3_1_agent_invokes_another_agent_agentic(
+        self, make_agent, request
+    ):
         """
         AGENTIC Scenario 3.1: Agent Invokes Another Agent
         
@@ -68,133 +321,74 @@ class TestSection3AgentInvocationAgentic:
         - EnforcementService logic
         - Persistence layer details
         """
+        verbose = logger.isEnabledFor(logging.INFO)
+
         print("\n" + "=" * 70)
         print("AGENTIC TEST 3.1: Agent Invokes Another Agent")
         print("(External agent perspective - Zero mesh knowledge)")
         print("=" * 70)
 
         # Generate unique agent IDs for this test run
-        timestamp = int(time.time())
-        sales_agent_id = f"sales-agent-inv-agentic-{timestamp}"
-        eng_agent_id = f"engineering-agent-inv-agentic-{timestamp}"
-        
-        # ========== STEP 1: Sales Agent Connects and Registers ==========
-        print("\n1. Sales agent connecting to mesh via NATS...")
-        sales_agent = self._track_agent(SimpleNATSAgent("nats://localhost:4222"))
+        suffix = _unique_suffix()
+        sales_agent_id = f"sales-agent-inv-agentic-{suffix}"
+        eng_agent_id = f"engineering-agent-inv-agentic-{suffix}"
         
-        try:
-            await sales_agent.connect_to_mesh()
-        except Exception as e:
-            pytest.skip(f"Cannot connect to NATS - is mesh running? Error: {e}")
-
-        print("   ✓ Connected to NATS")
-
-        # Register sales agent
-        print(f"   Registering as '{sales_agent_id}'...")
-        try:
-            sales_registration = await sales_agent.register_with_mesh(
-                identity=sales_agent_id,
-                version="1.0.0",
-                capabilities=["invoke_agent", "query_kb"],
-                operations=["invoke", "query"],
+        # ========== STEPS 1-2: Sales and Engineering Agents Register ==========
+        print("\n1-2. Sales and engineering agents registering in parallel...")
+        async with asyncio.TaskGroup() as tg:
+            t_sales = tg.create_task(
+                _bring_up(
+                    make_agent,
+                    identity=sales_agent_id,
+                    version="1.0.0",
+                    capabilities=["invoke_agent", "query_kb"],
+                    operations=["invoke", "query"],
+                )
             )
-            print(f"   ✓ Sales agent registered (status: {sales_registration.get('status')})")
-        except RuntimeError as e:
-            pytest.skip(f"Mesh not responding - is it running? Error: {e}")
-
-        # ========== STEP 2: Engineering Agent Connects and Registers ==========
-        print("\n2. Engineering agent connecting to mesh via NATS...")
-        eng_agent = self._track_agent(SimpleNATSAgent("nats://localhost:4222"))
-        await eng_agent.connect_to_mesh()
-        print("   ✓ Connected to NATS")
-
-        # Register engineering agent
-        print(f"   Registering as '{eng_agent_id}'...")
-        eng_registration = await eng_agent.register_with_mesh(
-            identity=eng_agent_id,
-            version="2.0.0",
-            capabilities=["prioritize_feature", "deploy", "code_review"],
-            operations=["execute", "invoke"],
-        )
-        print(f"   ✓ Engineering agent registered (status: {eng_registration.get('status')})")
+            t_eng = tg.create_task(
+                _bring_up(
+                    make_agent,
+                    identity=eng_agent_id,
+                    version="2.0.0",
+                    capabilities=["prioritize_feature", "deploy", "code_review"],
+                    operations=["execute", "invoke"],
+                )
+            )
+
+        sales_agent, sales_registration = t_sales.result()
+        eng_agent, eng_registration = t_eng.result()
+        print(f"   ✓ Sales agent '{sales_agent_id}' registered (status: {sales_registration.get('status')})")
+        print(f"   ✓ Engineering agent '{eng_agent_id}' registered (status: {eng_registration.get('status')})")
 
         # ========== STEP 3: Engineering Agent Listens for Invocations ==========
         print("\n3. Engineering agent subscribing to invocation requests...")
         
-        received_invocations = []
-        completion_sent = asyncio.Event()
-
-        async def handle_invocation(invocation_msg: dict):
-            """
-            Engineering agent handles incoming invocation.
-            
-            This is what a real agent would do:
-            1. Receive invocation message
-            2. Process the request
-            3. Send completion notification back to mesh
-            """
-            print("\n   [Engineering Agent] 📥 Received invocation!")
-            print(f"     - Tracking ID: {invocation_msg.get('tracking_id')}")
-            print(f"     - From: {invocation_msg.get('source')}")
-            print(f"     - Operation: {invocation_msg.get('operation')}")
-            print(f"     - Payload: {json.dumps(invocation_msg.get('payload'), indent=2)}")
-            
-            received_invocations.append(invocation_msg)
-            
-            # Simulate processing work
-            await asyncio.sleep(0.2)
-            
-            # Send completion back to mesh via NATS
-            tracking_id = invocation_msg.get("tracking_id")
-            result_data = {
-                "priority": "P0",
-                "sprint": "Sprint-42",
-                "estimated_effort": "5 days",
-                "assigned_to": "engineering-team-alpha",
-                "feature": invocation_msg.get("payload", {}).get("feature"),
-            }
-            
-            print(f"\n   [Engineering Agent] 📤 Sending completion...")
-            await eng_agent.send_completion(
-                tracking_id=tracking_id,
-                status="complete",
-                result=result_data,
-            )
-            print(f"     ✓ Completion sent for {tracking_id}")
-            completion_sent.set()
+        # Resolved per tracking ID, so stale messages from earlier runs can
+        # never satisfy this test's waits
+        pending_invocations: dict[str, asyncio.Future] = {}
 
         # Subscribe to invocations
-        await eng_agent.subscribe_to_invocations(handle_invocation)
+        invocation_handler = _InvocationHandler(
+            eng_agent,
+            "Engineering Agent",
+            _prioritization_result,
+            pending=pending_invocations,
+            verbose=verbose,
+        )
+        await eng_agent.subscribe_to_invocations(invocation_handler)
         print("   ✓ Engineering agent listening for invocations")
 
         # ========== STEP 4: Sales Agent Subscribes to Notifications ==========
         print("\n4. Sales agent subscribing to notifications...")
         
-        received_notifications = []
-        notification_received = asyncio.Event()
-
-        async def handle_notification(notification_msg: dict):
-            """
-            Sales agent receives completion notifications.
-            
-            This is how source agents know when invocations complete.
-            """
-            print("\n   [Sales Agent] 📥 Received notification!")
-            print(f"     - Type: {notification_msg.get('type')}")
-            print(f"     - Tracking ID: {notification_msg.get('tracking_id')}")
-            print(f"     - Status: {notification_msg.get('status')}")
-            if notification_msg.get("result"):
-                print(f"     - Result: {json.dumps(notification_msg.get('result'), indent=2)}")
-            
-            received_notifications.append(notification_msg)
-            notification_received.set()
+        pending_notifications: dict[str, asyncio.Future] = {}
 
-        await sales_agent.subscribe_to_notifications(handle_notification)
+        notification_handler = _NotificationHandler(
+            "Sales Agent", pending_notifications, verbose=verbose
+        )
+        await sales_agent.subscribe_to_notifications(notification_handler)
         print("   ✓ Sales agent listening for notifications")
 
-        # Give subscriptions a moment to be ready
-        await asyncio.sleep(0.5)
-
         # ========== STEP 5: Sales Agent Invokes Engineering Agent ==========
         print("\n5. Sales agent invoking engineering agent through mesh...")
         
@@ -205,23 +399,28 @@ class TestSection3AgentInvocationAgentic:
             "revenue_impact": "$500K",
             "urgency": "critical",
         }
+        # Format once, and only when someone will read it
+        invoke_payload_pp = _pp(invoke_payload) if verbose else ""
         
         print(f"   Request details:")
         print(f"     - Target: {eng_agent_id}")
         print(f"     - Operation: prioritize_feature")
-        print(f"     - Payload: {json.dumps(invoke_payload, indent=2)}")
+        if verbose:
+            logger.info("Invoke payload: %s", invoke_payload_pp)
 
         # Invoke via mesh (through NATS)
+        t_invoke = time.perf_counter_ns()
         invoke_response = await sales_agent.invoke_agent(
             target_agent_id=eng_agent_id,
             operation="prioritize_feature",
             payload=invoke_payload,
-            timeout=10.0,
+            timeout=_INVOKE_TIMEOUT,
         )
 
         # ========== STEP 6: Verify Invocation Response ==========
         print(f"\n6. Verifying invocation response from mesh...")
-        print(f"   Response: {json.dumps(invoke_response, indent=2)}")
+        if verbose:
+            logger.info("Invoke response: %s", _pp(invoke_response))
 
         # Check status
         assert invoke_response.get("status") != "denied", (
@@ -251,15 +450,11 @@ class TestSection3AgentInvocationAgentic:
         
         try:
             # Wait for engineering agent to receive and process
-            await asyncio.wait_for(completion_sent.wait(), timeout=5.0)
+            invocation = await asyncio.wait_for(
+                _future_for(pending_invocations, tracking_id), timeout=_WAIT_TIMEOUT
+            )
             print(f"   ✓ Engineering agent received and processed invocation")
-            
-            # Verify invocation message
-            assert len(received_invocations) > 0, "Engineering agent should receive invocation"
-            # Get the invocation with matching tracking ID
-            invocation = next((inv for inv in received_invocations if inv.get("tracking_id") == tracking_id), received_invocations[-1])
-            
-            assert invocation.get("tracking_id") == tracking_id
+
             assert invocation.get("operation") == "prioritize_feature"
             assert invocation.get("payload") == invoke_payload
             print(f"   ✓ Invocation data matches original request")
@@ -275,20 +470,12 @@ class TestSection3AgentInvocationAgentic:
         
         try:
             # Wait for notification
-            await asyncio.wait_for(notification_received.wait(), timeout=5.0)
-            print(f"   ✓ Sales agent received completion notification")
-            
-            # Verify notification
-            assert len(received_notifications) > 0, "Sales agent should receive notification"
-            
-            # Find the notification with matching tracking ID (there might be multiple from previous test runs)
-            notification = next(
-                (n for n in received_notifications if n.get("tracking_id") == tracking_id),
-                received_notifications[0]  # Fallback to first
+            notification = await asyncio.wait_for(
+                _future_for(pending_notifications, tracking_id), timeout=_WAIT_TIMEOUT
             )
-            
+            print(f"   ✓ Sales agent received completion notification")
+
             assert notification.get("type") == "invocation_complete"
-            assert notification.get("tracking_id") == tracking_id
             assert notification.get("status") == "complete"
             assert notification.get("result") is not None
             print(f"   ✓ Notification data is valid")
@@ -306,6 +493,16 @@ class TestSection3AgentInvocationAgentic:
                 "Check if mesh notification routing is working properly."
             )
 
+        # Latency telemetry for CI to diff across runs (junitxml properties)
+        t_received = invocation_handler.received_ns[tracking_id]
+        t_notified = notification_handler.received_ns[tracking_id]
+        request.node.user_properties.append(
+            ("mesh_invoke_us", (t_received - t_invoke) // 1000)
+        )
+        request.node.user_properties.append(
+            ("mesh_rtt_us", (t_notified - t_invoke) // 1000)
+        )
+
         # ========== STEP 9: Summary ==========
         print("\n" + "=" * 70)
         print("✅ AGENTIC TEST 3.1 PASSED")
@@ -328,7 +525,9 @@ class TestSection3AgentInvocationAgentic:
         print("  - Lifecycle tracking")
         print("=" * 70)
 
-    async def test_scenario_3_2_agent_discovery_before_invocation_agentic(self):
+    async def test_scenario_3_2_agent_discovery_before_invocation_agentic(
+        self, make_agent
+    ):
         """
         AGENTIC Scenario 3.2: Agent Discovers Target Before Invocation
         
@@ -344,56 +543,46 @@ class TestSection3AgentInvocationAgentic:
         print("=" * 70)
 
         # Generate unique agent IDs for this test run
-        timestamp = int(time.time())
-        marketing_agent_id = f"marketing-agent-discovery-{timestamp}"
-        support_agent_id = f"support-agent-discovery-{timestamp}"
-        
-        # ========== STEP 1: Marketing Agent Connects ==========
-        print("\n1. Marketing agent connecting and registering...")
-        marketing_agent = self._track_agent(SimpleNATSAgent("nats://localhost:4222"))
+        suffix = _unique_suffix()
+        marketing_agent_id = f"marketing-agent-discovery-{suffix}"
+        support_agent_id = f"support-agent-discovery-{suffix}"
         
-        try:
-            await marketing_agent.connect_to_mesh()
-        except Exception as e:
-            pytest.skip(f"Cannot connect to NATS: {e}")
-
-        await marketing_agent.register_with_mesh(
-            identity=marketing_agent_id,
-            version="1.0.0",
-            capabilities=["analytics", "invoke_agent"],
-            operations=["query", "invoke"],
-        )
-        print(f"   ✓ Marketing agent registered as {marketing_agent_id}")
+        # ========== STEPS 1-2: Marketing and Support Agents Register ==========
+        print("\n1-2. Marketing and support agents registering in parallel...")
+        async with asyncio.TaskGroup() as tg:
+            t_marketing = tg.create_task(
+                _bring_up(
+                    make_agent,
+                    identity=marketing_agent_id,
+                    version="1.0.0",
+                    capabilities=["analytics", "invoke_agent"],
+                    operations=["query", "invoke"],
+                )
+            )
+            t_support = tg.create_task(
+                _bring_up(
+                    make_agent,
+                    identity=support_agent_id,
+                    version="1.0.0",
+                    capabilities=["customer_feedback", "ticket_analysis"],
+                    operations=["execute", "invoke"],
+                )
+            )
 
-        # ========== STEP 2: Support Agent Connects ==========
-        print("\n2. Support agent connecting and registering...")
-        support_agent = self._track_agent(SimpleNATSAgent("nats://localhost:4222"))
-        await support_agent.connect_to_mesh()
-        
-        await support_agent.register_with_mesh(
-            identity=support_agent_id,
-            version="1.0.0",
-            capabilities=["customer_feedback", "ticket_analysis"],
-            operations=["execute", "invoke"],
-        )
+        marketing_agent, _ = t_marketing.result()
+        support_agent, _ = t_support.result()
+        print(f"   ✓ Marketing agent registered as {marketing_agent_id}")
         print(f"   ✓ Support agent registered as {support_agent_id}")
 
         # Support agent listens for invocations
-        invocations_received = []
-        
-        async def handle_invocation(msg):
-            invocations_received.append(msg)
-            await support_agent.send_completion(
-                tracking_id=msg.get("tracking_id"),
-                status="complete",
-                result={"feedback_summary": "Feature X highly requested"},
-            )
-
-        await support_agent.subscribe_to_invocations(handle_invocation)
-        await asyncio.sleep(0.3)  # Let subscription settle
+        await support_agent.subscribe_to_invocations(
+            _InvocationHandler(support_agent, "Support Agent", _feedback_result)
+        )
 
-        # Wait for agents to be registered in directory
-        await asyncio.sleep(1.0)
+        # Wait for the support agent to show up in the directory
+        await _discover_until_present(
+            marketing_agent, support_agent_id, capability_filter="customer_feedback"
+        )
 
         # ========== STEP 3: Marketing Discovers Agents ==========
         print("\n3. Marketing agent discovering available agents...")
@@ -434,15 +623,10 @@ class TestSection3AgentInvocationAgentic:
             pytest.skip(f"Could not find newly created agent {support_agent_id} in discovery results")
 
         # Setup notification listener
-        notifications = []
-        notif_event = asyncio.Event()
-        
-        async def handle_notif(msg):
-            notifications.append(msg)
-            notif_event.set()
-
-        await marketing_agent.subscribe_to_notifications(handle_notif)
-        await asyncio.sleep(0.2)
+        pending_notifications: dict[str, asyncio.Future] = {}
+        await marketing_agent.subscribe_to_notifications(
+            _NotificationHandler("Marketing Agent", pending_notifications)
+        )
 
         # Invoke
         response = await marketing_agent.invoke_agent(
@@ -452,17 +636,19 @@ class TestSection3AgentInvocationAgentic:
         )
 
         assert response.get("status") != "denied", f"Invocation denied: {response.get('error')}"
-        assert response.get("tracking_id"), "Should have tracking ID"
-        print(f"   ✓ Invocation initiated: {response.get('tracking_id')}")
+        tracking_id = response.get("tracking_id")
+        assert tracking_id, "Should have tracking ID"
+        print(f"   ✓ Invocation initiated: {tracking_id}")
 
         # ========== STEP 5: Wait for Completion ==========
         print("\n5. Waiting for completion...")
         
         try:
-            await asyncio.wait_for(notif_event.wait(), timeout=3.0)
-            assert len(notifications) > 0
-            assert notifications[0].get("type") == "invocation_complete"
-            print(f"   ✓ Completion received: {notifications[0].get('result')}")
+            notification = await asyncio.wait_for(
+                _future_for(pending_notifications, tracking_id), timeout=_WAIT_TIMEOUT
+            )
+            assert notification.get("type") == "invocation_complete"
+            print(f"   ✓ Completion received: {notification.get('result')}")
         except asyncio.TimeoutError:
             pytest.fail("Did not receive completion notification")
 
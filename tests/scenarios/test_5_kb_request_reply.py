@@ -7,14 +7,20 @@ Tests scenarios:
 """
 
 import asyncio
-import json
-from datetime import datetime
+import logging
+import os
+from decimal import Decimal
+from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
 
 import pytest
+import pytest_asyncio
 
 from adapters.knowledge_base.postgres.adapter import PostgresAdapter
 from adapters.messaging.nats_client import NATSWrapper
-from adapters.persistence.schemas import AuditEventType, AuditOutcome, AuditQuery
+from adapters.persistence import AuditBuffer
+from adapters.persistence.schemas import AuditEventType, AuditOutcome
 from adapters.persistence.sqlite.adapter import SQLitePersistenceAdapter
 from adapters.policy.opa_client import OPAClient
 from services.enforcement import EnforcementService
@@ -26,143 +32,400 @@ from services.registry.schemas import (
 )
 from services.routing import KBQueryRequest, RequestRouter
 
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# Progress output goes through logging: silent by default, visible with
+# --log-cli-level=DEBUG
+logger = logging.getLogger(__name__)
+
+# Namespace entities per xdist worker so this module can run alongside the
+# other scenario files (``pytest -n auto --dist loadfile``) without sharing
+# NATS subjects, OPA policies, Postgres tables or SQLite rows.
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+MARKETING_AGENT_ID = f"marketing-agent-{WORKER_ID}"
+SALES_AGENT_ID = f"sales-agent-{WORKER_ID}"
+SALES_KB_ID = f"sales-kb-{WORKER_ID}"
+OFFLINE_KB_ID = f"offline-kb-{WORKER_ID}"
+DEALS_TABLE = f"deals_{WORKER_ID}"
+FIELD_MASKING_POLICY = f"field_masking_test_{WORKER_ID}"
+OFFLINE_KB_POLICY = f"offline_kb_policy_{WORKER_ID}"
+NO_MASKING_POLICY = f"no_masking_policy_{WORKER_ID}"
+
+_DEALS_ROWS = [
+    ("APAC", Decimal("50000.00"), "alice@example.com", "+1-555-0001"),
+    ("EMEA", Decimal("75000.00"), "bob@example.com", "+1-555-0002"),
+    ("APAC", Decimal("30000.00"), "charlie@example.com", "+1-555-0003"),
+]
+
+SQLITE_CONFIG_TEMPLATE = """
+adapter:
+  type: "sqlite"
+  version: "1.0.0"
+
+database:
+  path: "file:agentmesh_test_{worker_id}?mode=memory&cache=shared"
+  journal_mode: "MEMORY"
+  synchronous: "OFF"
+
+audit:
+  retention_days: 90
+  default_level: "lightweight"
+"""
 
-class TestSection5KBRequestReply:
-    """Test KB Request-Reply Pattern scenarios"""
+# Section 5 policies, uploaded once per session. They match disjoint
+# principal/resource pairs so they can coexist; none declares
+# ``default allow`` because OPA rejects duplicate defaults across modules.
+_TEST_POLICY_REGO = {
+    # Masks customer contact fields for the marketing agent
+    FIELD_MASKING_POLICY: f"""
+package agentmesh
 
-    @pytest.fixture(autouse=True)
-    async def setup(self):
-        """Setup test fixtures"""
-        # Initialize persistence adapter
-        self.persistence = SQLitePersistenceAdapter(
-            "adapters/persistence/sqlite/config.yaml"
-        )
-        await self.persistence.connect()
+allow if {{
+    input.principal == "{MARKETING_AGENT_ID}"
+    input.resource == "{SALES_KB_ID}"
+    input.action == "query"
+}}
+
+mask_fields := ["customer_email", "customer_phone"] if {{
+    input.principal == "{MARKETING_AGENT_ID}"
+    input.resource == "{SALES_KB_ID}"
+}}
+""",
+    # Allows the marketing agent to query the offline KB
+    OFFLINE_KB_POLICY: f"""
+package agentmesh
 
-        # Initialize NATS client
-        self.nats_client = NATSWrapper()
-        try:
-            await self.nats_client.connect()
-            self.nats_available = True
-        except Exception:
-            self.nats_available = False
-            self.nats_client = None
-            pytest.skip("NATS not available - required for KB request-reply tests")
-
-        # Initialize OPA client
-        self.opa_client = OPAClient()
-        try:
-            is_healthy = await self.opa_client.health_check()
-            if not is_healthy:
-                pytest.skip("OPA not available - required for policy tests")
-        except Exception:
-            pytest.skip("OPA not available - required for policy tests")
-
-        # Initialize KB adapters
-        self.postgres_adapter = PostgresAdapter(
-            "adapters/knowledge_base/postgres/config.yaml",
-            nats_client=self.nats_client,
-            kb_id="sales-kb-1",
-        )
-        await self.postgres_adapter.connect()
-
-        # Initialize services
-        self.agent_service = AgentService(self.persistence, self.nats_client)
-        self.kb_service = KBService(self.persistence, self.nats_client)
-        self.health_service = HealthService(self.persistence)
-
-        # Initialize enforcement service
-        kb_adapters = {"postgres": self.postgres_adapter}
-        self.enforcement_service = EnforcementService(
-            opa_client=self.opa_client,
-            persistence=self.persistence,
-            kb_adapters=kb_adapters,
-            nats_client=self.nats_client,
+allow if {{
+    input.principal == "{MARKETING_AGENT_ID}"
+    input.resource == "{OFFLINE_KB_ID}"
+    input.action == "query"
+}}
+""",
+    # Allows the sales agent without any masking rules
+    NO_MASKING_POLICY: f"""
+package agentmesh
+
+allow if {{
+    input.principal == "{SALES_AGENT_ID}"
+    input.resource == "{SALES_KB_ID}"
+    input.action == "query"
+}}
+""",
+}
+
+# Registration fields for the test agents, keyed by identity. They are
+# test-controlled constants, so requests are built with model_construct and
+# skip validation.
+_TEST_AGENTS: dict[str, dict[str, Any]] = {
+    MARKETING_AGENT_ID: {
+        "version": "1.0.0",
+        "capabilities": ["query_kb", "analyze_data"],
+        "operations": ["query"],
+        "health_endpoint": "http://localhost:8001/health",
+        "metadata": {"team": "marketing", "region": "global"},
+    },
+    SALES_AGENT_ID: {
+        "version": "1.0.0",
+        "capabilities": ["query_kb", "write_kb"],
+        "operations": ["query", "execute"],
+        "health_endpoint": "http://localhost:8002/health",
+        "metadata": {"team": "sales", "region": "global"},
+    },
+}
+
+# KB requests are shared, read-only objects: the schema and metadata are
+# interned as mappings that cannot be mutated, and KBService copies them into
+# its own KBRegistration before storing.
+_DEALS_KB_SCHEMA = MappingProxyType(
+    {
+        "tables": {
+            DEALS_TABLE: {
+                "columns": (
+                    "id",
+                    "region",
+                    "revenue",
+                    "customer_email",
+                    "customer_phone",
+                )
+            }
+        }
+    }
+)
+
+_SALES_KB_REQUEST = KBRegistrationRequest.model_construct(
+    kb_id=SALES_KB_ID,
+    kb_type="postgres",
+    endpoint="postgresql://localhost:5432/agentmesh",
+    operations=("sql_query",),
+    kb_schema=_DEALS_KB_SCHEMA,
+    metadata=MappingProxyType(
+        {"owner": "sales", "description": "Sales deals database"}
+    ),
+)
+
+# Offline KB with an invalid connection string
+_OFFLINE_KB_REQUEST = KBRegistrationRequest.model_construct(
+    kb_id=OFFLINE_KB_ID,
+    kb_type="postgres",
+    endpoint="postgresql://invalid:9999/nonexistent",
+    operations=("sql_query",),
+    kb_schema=MappingProxyType({"tables": {}}),
+    metadata=MappingProxyType(
+        {"owner": "test", "description": "Offline KB for testing"}
+    ),
+)
+
+_TEST_KBS = {SALES_KB_ID: _SALES_KB_REQUEST, OFFLINE_KB_ID: _OFFLINE_KB_REQUEST}
+
+
+async def _wait_until(predicate, timeout=1.0, interval=0.02):
+    """Poll an async predicate until it returns a truthy value or time runs out.
+
+    Args:
+        predicate: Zero-argument callable returning an awaitable
+        timeout: Maximum time to wait in seconds
+        interval: Delay between polls in seconds
+
+    Returns:
+        The last value returned by the predicate
+    """
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not (result := await predicate()):
+        if asyncio.get_running_loop().time() >= deadline:
+            break
+        await asyncio.sleep(interval)
+    return result
+
+
+def _column(rows, field):
+    """Collect one field across result rows, skipping rows without it"""
+    return [row[field] for row in rows if field in row]
+
+
+def _worker_sqlite_config(base_dir: Path) -> str:
+    """Write (once) a SQLite config for this worker's in-memory database."""
+    config_path = base_dir / f"sqlite-kb-{WORKER_ID}.yaml"
+    if not config_path.exists():
+        config_path.write_text(SQLITE_CONFIG_TEMPLATE.format(worker_id=WORKER_ID))
+    return str(config_path)
+
+
+async def _register_agent(agent_service, identity, **overrides):
+    """Register a test agent from its constant fields"""
+    request = AgentRegistrationRequest.model_construct(
+        identity=identity, **(_TEST_AGENTS[identity] | overrides)
+    )
+    return await agent_service.register_agent(request)
+
+
+async def _register_kb(kb_service, kb_id, **overrides):
+    """Register a test KB from its shared request"""
+    request = _TEST_KBS[kb_id]
+    if overrides:
+        request = request.model_copy(update=overrides)
+    return await kb_service.register_kb(request)
+
+
+async def _cleanup_test_entities(agent_service, kb_service):
+    """Clean up test entities that might exist from previous runs"""
+    await asyncio.gather(
+        *(agent_service.deregister_agent(identity) for identity in _TEST_AGENTS),
+        *(kb_service.deregister_kb(kb_id) for kb_id in _TEST_KBS),
+        return_exceptions=True,
+    )
+
+
+async def _delete_test_policies(opa_client):
+    """Delete the policies uploaded by Section 5 scenarios"""
+    await asyncio.gather(
+        *(
+            opa_client.delete_policy(policy_id, delete_file=False)
+            for policy_id in _TEST_POLICY_REGO
+        ),
+        return_exceptions=True,
+    )
+
+
+async def _upload_test_policies(opa_client):
+    """Upload the Section 5 policies and wait until OPA has loaded them"""
+    results = await asyncio.gather(
+        *(
+            opa_client.upload_policy(policy_id, policy_rego, persist=False)
+            for policy_id, policy_rego in _TEST_POLICY_REGO.items()
         )
+    )
+    assert all(result["success"] for result in results)
 
-        # Initialize request router
-        self.request_router = RequestRouter(
-            enforcement=self.enforcement_service,
-            persistence=self.persistence,
-            nats_client=self.nats_client,
+    async def _all_loaded():
+        policies = await asyncio.gather(
+            *(opa_client.get_policy(policy_id) for policy_id in _TEST_POLICY_REGO)
         )
-        await self.request_router.start()
+        return all("error" not in policy for policy in policies)
+
+    await _wait_until(_all_loaded)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def kb_mesh(tmp_path_factory):
+    """Connect the mesh components once and share them across Section 5 tests.
+
+    Yields:
+        SimpleNamespace holding the adapters, services and router
+    """
+    # Initialize persistence adapter (one shared-cache in-memory DB per worker)
+    persistence = SQLitePersistenceAdapter(
+        _worker_sqlite_config(tmp_path_factory.getbasetemp())
+    )
+    await persistence.connect()
+
+    # Initialize NATS client
+    nats_client = NATSWrapper()
+    try:
+        await nats_client.connect()
+    except Exception:
+        await persistence.disconnect()
+        pytest.skip("NATS not available - required for KB request-reply tests")
+
+    # Initialize OPA client
+    opa_client = OPAClient()
+    try:
+        is_healthy = await opa_client.health_check()
+    except Exception:
+        is_healthy = False
+    if not is_healthy:
+        await nats_client.disconnect()
+        await persistence.disconnect()
+        pytest.skip("OPA not available - required for policy tests")
+
+    # Initialize KB adapters
+    postgres_adapter = PostgresAdapter(
+        "adapters/knowledge_base/postgres/config.yaml",
+        nats_client=nats_client,
+        kb_id=SALES_KB_ID,
+    )
+    await postgres_adapter.connect()
+
+    # Initialize enforcement service (batched audit writes) and request router
+    audit_buffer = AuditBuffer(persistence)
+    await audit_buffer.start()
+    enforcement_service = EnforcementService(
+        opa_client=opa_client,
+        persistence=persistence,
+        kb_adapters={"postgres": postgres_adapter},
+        nats_client=nats_client,
+        audit_buffer=audit_buffer,
+    )
+    request_router = RequestRouter(
+        enforcement=enforcement_service,
+        persistence=persistence,
+        nats_client=nats_client,
+    )
+    await request_router.start()
+
+    # Start KB adapter listening
+    await postgres_adapter.start_listening()
+
+    # Upload the test policies once for the whole session
+    await _upload_test_policies(opa_client)
+
+    # Register the test agents and KBs once for the whole session
+    agent_service = AgentService(persistence, nats_client)
+    kb_service = KBService(persistence, nats_client)
+    await _cleanup_test_entities(agent_service, kb_service)
+    responses = await asyncio.gather(
+        *(_register_agent(agent_service, identity) for identity in _TEST_AGENTS),
+        *(_register_kb(kb_service, kb_id) for kb_id in _TEST_KBS),
+    )
+    registered = dict(zip([*_TEST_AGENTS, *_TEST_KBS], responses, strict=True))
+
+    yield SimpleNamespace(
+        persistence=persistence,
+        nats_client=nats_client,
+        opa_client=opa_client,
+        postgres_adapter=postgres_adapter,
+        agent_service=agent_service,
+        kb_service=kb_service,
+        health_service=HealthService(persistence),
+        audit_buffer=audit_buffer,
+        enforcement_service=enforcement_service,
+        request_router=request_router,
+        registered=registered,
+    )
+
+    # Cleanup
+    await asyncio.gather(
+        _cleanup_test_entities(agent_service, kb_service),
+        _delete_test_policies(opa_client),
+    )
+    await audit_buffer.stop()
+    # The router owns the NATS connection and closes it on stop; the remaining
+    # connections are independent, so close them in parallel
+    await asyncio.gather(
+        postgres_adapter.disconnect(),
+        request_router.stop(),
+        persistence.disconnect(),
+        return_exceptions=True,
+    )
+
 
-        # Start KB adapter listening
-        await self.postgres_adapter.start_listening()
+class TestSection5KBRequestReply:
+    """Test KB Request-Reply Pattern scenarios"""
 
-        # Clean up test entities
-        await self._cleanup_test_entities()
+    @pytest.fixture(autouse=True)
+    async def setup(self, kb_mesh):
+        """Bind the shared mesh handles and reset per-test state"""
+        vars(self).update(vars(kb_mesh))
 
-        # Setup test data in PostgreSQL
+        # Reset test data in PostgreSQL
         await self._setup_test_data()
 
-        yield
-
-        # Cleanup
-        await self.postgres_adapter.disconnect()
-        await self.request_router.stop()
-        if self.nats_client:
-            try:
-                await self.nats_client.disconnect()
-            except Exception:
-                pass  # Ignore disconnect errors
-        await self.persistence.disconnect()
-
-    async def _cleanup_test_entities(self):
-        """Clean up test entities that might exist from previous runs"""
-        test_agents = ["marketing-agent-1", "sales-agent-1"]
-        test_kbs = ["sales-kb-1", "offline-kb-1"]
-
-        for agent_id in test_agents:
-            try:
-                await self.agent_service.deregister_agent(agent_id)
-            except Exception:
-                pass
-
-        for kb_id in test_kbs:
-            try:
-                await self.kb_service.deregister_kb(kb_id)
-            except Exception:
-                pass
+    async def _ensure_agent(self, identity, **overrides):
+        """Return the session registration for an agent, registering on a miss"""
+        if identity not in self.registered:
+            self.registered[identity] = await _register_agent(
+                self.agent_service, identity, **overrides
+            )
+        return self.registered[identity]
+
+    async def _ensure_kb(self, kb_id, **overrides):
+        """Return the session registration for a KB, registering on a miss"""
+        if kb_id not in self.registered:
+            self.registered[kb_id] = await _register_kb(
+                self.kb_service, kb_id, **overrides
+            )
+        return self.registered[kb_id]
+
+    async def _policy_loaded(self, policy_id):
+        """Check whether OPA has loaded the given policy"""
+        return "error" not in await self.opa_client.get_policy(policy_id)
 
     async def _setup_test_data(self):
         """Setup test data in PostgreSQL"""
         try:
-            # Create test table
-            await self.postgres_adapter.execute(
-                "sql_query",
-                query="""
-                CREATE TABLE IF NOT EXISTS deals (
+            # Create and clear the test table
+            await self.postgres_adapter._direct_execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {DEALS_TABLE} (
                     id SERIAL PRIMARY KEY,
                     region VARCHAR(100),
                     revenue DECIMAL(10,2),
                     customer_email VARCHAR(255),
                     customer_phone VARCHAR(50)
-                )
+                );
+                TRUNCATE {DEALS_TABLE};
                 """
             )
 
-            # Clear existing data
-            await self.postgres_adapter.execute(
-                "sql_query",
-                query="DELETE FROM deals"
-            )
-
             # Insert test data
-            await self.postgres_adapter.execute(
-                "sql_query",
-                query="""
-                INSERT INTO deals (region, revenue, customer_email, customer_phone)
-                VALUES 
-                    ('APAC', 50000.00, 'alice@example.com', '+1-555-0001'),
-                    ('EMEA', 75000.00, 'bob@example.com', '+1-555-0002'),
-                    ('APAC', 30000.00, 'charlie@example.com', '+1-555-0003')
-                """
+            await self.postgres_adapter.execute_many(
+                f"INSERT INTO {DEALS_TABLE} "
+                "(region, revenue, customer_email, customer_phone) "
+                "VALUES ($1, $2, $3, $4)",
+                _DEALS_ROWS,
             )
-            print("✓ Test data setup complete")
+            logger.debug("✓ Test data setup complete")
         except Exception as e:
-            print(f"⚠ Error setting up test data: {e}")
+            logger.warning("⚠ Error setting up test data: %s", e)
 
     async def test_scenario_5_1_agent_queries_kb_via_mesh(self):
         """
@@ -178,89 +441,31 @@ class TestSection5KBRequestReply:
           ✓ Response forwarded to Agent-Marketing
           ✓ Audit log: agent_id, kb_id, query_type, outcome, latency
         """
-        print("\n" + "=" * 70)
-        print("TEST SCENARIO 5.1: Agent Queries KB via Mesh")
-        print("=" * 70)
-
-        # Step 1: Register Marketing Agent
-        print("\n[Step 1] Registering Marketing Agent...")
-        agent_request = AgentRegistrationRequest(
-            identity="marketing-agent-1",
-            version="1.0.0",
-            capabilities=["query_kb", "analyze_data"],
-            operations=["query"],
-            health_endpoint="http://localhost:8001/health",
-            metadata={"team": "marketing", "region": "global"},
-        )
-        agent_response = await self.agent_service.register_agent(agent_request)
-        assert agent_response.identity == "marketing-agent-1"
-        print(f"✓ Marketing agent registered: {agent_response.identity}")
-
-        # Step 2: Register Sales KB
-        print("\n[Step 2] Registering Sales KB...")
-        kb_request = KBRegistrationRequest(
-            kb_id="sales-kb-1",
-            kb_type="postgres",
-            endpoint="postgresql://localhost:5432/agentmesh",
-            operations=["sql_query"],
-            kb_schema={
-                "tables": {
-                    "deals": {
-                        "columns": ["id", "region", "revenue", "customer_email", "customer_phone"]
-                    }
-                }
-            },
-            metadata={
-                "owner": "sales",
-                "description": "Sales deals database"
-            },
-        )
-        kb_response = await self.kb_service.register_kb(kb_request)
-        assert kb_response.kb_id == "sales-kb-1"
-        print(f"✓ Sales KB registered: {kb_response.kb_id}")
-
-        # Step 3: Create policy for field masking
-        print("\n[Step 3] Creating field-level masking policy...")
-        
-        # Clean up any existing policies first
-        await self.opa_client.delete_policy("field_masking_test", delete_file=False)
-        await self.opa_client.delete_policy("offline_kb_policy", delete_file=False)
-        await self.opa_client.delete_policy("no_masking_policy", delete_file=False)
-        await asyncio.sleep(0.2)
-        
-        policy_rego = """
-package agentmesh
-
-default allow = false
-
-allow if {
-    input.principal == "marketing-agent-1"
-    input.resource == "sales-kb-1"
-    input.action == "query"
-}
-
-mask_fields := ["customer_email", "customer_phone"] if {
-    input.principal == "marketing-agent-1"
-    input.resource == "sales-kb-1"
-}
-"""
-        policy_result = await self.opa_client.upload_policy(
-            "field_masking_test", policy_rego, persist=False
+        logger.debug("TEST SCENARIO 5.1: Agent Queries KB via Mesh")
+
+        # Steps 1-3: Marketing Agent, Sales KB and field masking policy are in
+        # place. They touch disjoint resources, so check them concurrently.
+        logger.debug("[Steps 1-3] Checking agent, KB and masking policy...")
+        agent_response, kb_response, policy_loaded = await asyncio.gather(
+            self._ensure_agent(MARKETING_AGENT_ID),
+            self._ensure_kb(SALES_KB_ID),
+            self._policy_loaded(FIELD_MASKING_POLICY),
         )
-        assert policy_result["success"]
-        print("✓ Field masking policy created")
-
-        # Wait for policy to propagate
-        await asyncio.sleep(0.5)
+        assert agent_response.identity == MARKETING_AGENT_ID
+        assert kb_response.kb_id == SALES_KB_ID
+        assert policy_loaded
+        logger.debug("✓ Marketing agent registered: %s", agent_response.identity)
+        logger.debug("✓ Sales KB registered: %s", kb_response.kb_id)
+        logger.debug("✓ Field masking policy loaded")
 
         # Step 4: Agent queries KB via mesh
-        print("\n[Step 4] Agent queries KB via mesh...")
+        logger.debug("[Step 4] Agent queries KB via mesh...")
         query_request = KBQueryRequest(
-            requester_id="marketing-agent-1",
-            kb_id="sales-kb-1",
+            requester_id=MARKETING_AGENT_ID,
+            kb_id=SALES_KB_ID,
             operation="sql_query",
             params={
-                "query": "SELECT region, revenue, customer_email, customer_phone FROM deals WHERE region='APAC'"
+                "query": f"SELECT region, revenue, customer_email, customer_phone FROM {DEALS_TABLE} WHERE region='APAC'"
             }
         )
 
@@ -268,53 +473,49 @@ mask_fields := ["customer_email", "customer_phone"] if {
 
         # Verify response status
         assert query_response.status == "success", f"Expected success, got {query_response.status}"
-        print(f"✓ Query routed successfully: {query_response.status}")
+        logger.debug("✓ Query routed successfully: %s", query_response.status)
 
         # Step 5: Verify KB executed query and returned data
-        print("\n[Step 5] Verifying KB execution and data...")
+        logger.debug("[Step 5] Verifying KB execution and data...")
         assert query_response.data is not None
         
         # Check if data is nested in rows
         rows = query_response.data.get("rows", query_response.data) if isinstance(query_response.data, dict) else query_response.data
         assert len(rows) > 0
-        print(f"✓ KB returned {len(rows)} rows")
+        logger.debug("✓ KB returned %d rows", len(rows))
         
-        # Display sample data
-        for i, row in enumerate(rows[:2], 1):
-            print(f"  Row {i}: {row}")
+        logger.debug("  Sample rows: %s", rows[:2])
 
         # Step 6: Verify field masking was applied
-        print("\n[Step 6] Verifying field masking...")
+        logger.debug("[Step 6] Verifying field masking...")
         assert "customer_email" in query_response.masked_fields
         assert "customer_phone" in query_response.masked_fields
-        print(f"✓ Fields masked: {query_response.masked_fields}")
+        logger.debug("✓ Fields masked: %s", query_response.masked_fields)
 
         # Verify masked fields are redacted
-        for row in rows:
-            if "customer_email" in row:
-                assert row["customer_email"] == "[REDACTED]", "customer_email should be masked"
-            if "customer_phone" in row:
-                assert row["customer_phone"] == "[REDACTED]", "customer_phone should be masked"
-        print("✓ Masked fields contain '[REDACTED]' as expected")
+        emails = _column(rows, "customer_email")
+        phones = _column(rows, "customer_phone")
+        assert set(emails) <= {"[REDACTED]"}, "customer_email should be masked"
+        assert set(phones) <= {"[REDACTED]"}, "customer_phone should be masked"
+        logger.debug("✓ Masked fields contain '[REDACTED]' as expected")
 
         # Step 7: Verify audit log
-        print("\n[Step 7] Verifying audit log...")
-        await asyncio.sleep(0.5)  # Wait for audit log to be written
-
-        audit_query = AuditQuery(
+        logger.debug("[Step 7] Verifying audit log...")
+        # Wait for buffered audit events to be written
+        await self.audit_buffer.flush()
+        audit_events = await self.persistence.query_audit_logs_prepared(
             event_type=AuditEventType.QUERY,
-            source_id="marketing-agent-1",
-            target_id="sales-kb-1",
+            source_id=MARKETING_AGENT_ID,
+            target_id=SALES_KB_ID,
             limit=5,
         )
-        audit_events = await self.persistence.query_audit_logs(audit_query)
         
         assert len(audit_events) > 0, "No audit events found"
         latest_event = audit_events[0]
         
         # Verify audit log contents
-        assert latest_event.source_id == "marketing-agent-1"
-        assert latest_event.target_id == "sales-kb-1"
+        assert latest_event.source_id == MARKETING_AGENT_ID
+        assert latest_event.target_id == SALES_KB_ID
         assert latest_event.event_type == AuditEventType.QUERY
         assert latest_event.outcome == AuditOutcome.SUCCESS
         
@@ -326,13 +527,13 @@ mask_fields := ["customer_email", "customer_phone"] if {
         assert latest_event.masked_fields is not None
         assert len(latest_event.masked_fields) > 0
         
-        print(f"✓ Audit log created:")
-        print(f"  - Event type: {latest_event.event_type}")
-        print(f"  - Outcome: {latest_event.outcome}")
-        print(f"  - Fields masked: {latest_event.masked_fields}")
-        print(f"  - Latency: {latest_event.request_metadata.get('latency_ms', 0):.2f}ms")
+        logger.debug("✓ Audit log created:")
+        logger.debug("  - Event type: %s", latest_event.event_type)
+        logger.debug("  - Outcome: %s", latest_event.outcome)
+        logger.debug("  - Fields masked: %s", latest_event.masked_fields)
+        logger.debug("  - Latency: %.2fms", latest_event.request_metadata.get('latency_ms', 0))
 
-        print("\n✅ SCENARIO 5.1 PASSED: Agent successfully queries KB via mesh with masking")
+        logger.debug("✅ SCENARIO 5.1 PASSED: Agent successfully queries KB via mesh with masking")
 
     async def test_scenario_5_2_kb_unavailable_error_handling(self):
         """
@@ -346,129 +547,85 @@ mask_fields := ["customer_email", "customer_phone"] if {
           ✓ Audit log records failure
           ✓ No partial data leaked
         """
-        print("\n" + "=" * 70)
-        print("TEST SCENARIO 5.2: KB Unavailable - Error Handling")
-        print("=" * 70)
-
-        # Step 1: Register Marketing Agent
-        print("\n[Step 1] Registering Marketing Agent...")
-        agent_request = AgentRegistrationRequest(
-            identity="marketing-agent-1",
-            version="1.0.0",
-            capabilities=["query_kb"],
-            operations=["query"],
-            health_endpoint="http://localhost:8001/health",
-            metadata={"team": "marketing"},
-        )
-        agent_response = await self.agent_service.register_agent(agent_request)
-        assert agent_response.identity == "marketing-agent-1"
-        print(f"✓ Marketing agent registered: {agent_response.identity}")
-
-        # Step 2: Register an offline KB (with invalid connection string)
-        print("\n[Step 2] Registering offline KB...")
-        kb_request = KBRegistrationRequest(
-            kb_id="offline-kb-1",
-            kb_type="postgres",
-            endpoint="postgresql://invalid:9999/nonexistent",
-            operations=["sql_query"],
-            kb_schema={"tables": {}},
-            metadata={"owner": "test", "description": "Offline KB for testing"},
+        logger.debug("TEST SCENARIO 5.2: KB Unavailable - Error Handling")
+
+        # Steps 1-2: Marketing Agent and offline KB (invalid connection string)
+        # are registered, and the allow policy for the offline KB is loaded
+        logger.debug("[Steps 1-2] Checking agent, offline KB and policy...")
+        agent_response, kb_response, policy_loaded = await asyncio.gather(
+            self._ensure_agent(MARKETING_AGENT_ID),
+            self._ensure_kb(OFFLINE_KB_ID),
+            self._policy_loaded(OFFLINE_KB_POLICY),
         )
-        kb_response = await self.kb_service.register_kb(kb_request)
-        assert kb_response.kb_id == "offline-kb-1"
-        print(f"✓ Offline KB registered: {kb_response.kb_id}")
+        assert agent_response.identity == MARKETING_AGENT_ID
+        assert kb_response.kb_id == OFFLINE_KB_ID
+        assert policy_loaded
+        logger.debug("✓ Marketing agent registered: %s", agent_response.identity)
+        logger.debug("✓ Offline KB registered: %s", kb_response.kb_id)
+        logger.debug("✓ Policy loaded")
 
         # Step 3: Check KB health status (should be offline)
-        print("\n[Step 3] Checking KB health status...")
+        logger.debug("[Step 3] Checking KB health status...")
         health_request = HealthCheckRequest(
             entity_type="kb",
-            entity_id="offline-kb-1"
+            entity_id=OFFLINE_KB_ID
         )
         health_response = await self.health_service.check_health(health_request)
         
-        print(f"✓ KB health check completed:")
-        print(f"  - Status: {health_response.status}")
-        print(f"  - Message: {health_response.message}")
+        logger.debug("✓ KB health check completed:")
+        logger.debug("  - Status: %s", health_response.status)
+        logger.debug("  - Message: %s", health_response.message)
         assert health_response.status == "offline", "KB should be offline"
 
-        # Step 4: Create allow policy for the offline KB
-        print("\n[Step 4] Creating allow policy for offline KB...")
-        
-        # Clean up any existing policies first
-        await self.opa_client.delete_policy("field_masking_test", delete_file=False)
-        await self.opa_client.delete_policy("offline_kb_policy", delete_file=False)
-        await self.opa_client.delete_policy("no_masking_policy", delete_file=False)
-        await asyncio.sleep(0.2)
-        
-        policy_rego = """
-package agentmesh
-
-default allow = false
-
-allow if {
-    input.principal == "marketing-agent-1"
-    input.resource == "offline-kb-1"
-    input.action == "query"
-}
-"""
-        policy_result = await self.opa_client.upload_policy(
-            "offline_kb_policy", policy_rego, persist=False
-        )
-        assert policy_result["success"]
-        print("✓ Policy created")
-
-        await asyncio.sleep(0.5)
-
-        # Step 5: Attempt to query the offline KB
-        print("\n[Step 5] Attempting to query offline KB...")
+        # Step 4: Attempt to query the offline KB
+        logger.debug("[Step 4] Attempting to query offline KB...")
         query_request = KBQueryRequest(
-            requester_id="marketing-agent-1",
-            kb_id="offline-kb-1",
+            requester_id=MARKETING_AGENT_ID,
+            kb_id=OFFLINE_KB_ID,
             operation="sql_query",
             params={"query": "SELECT * FROM test_table"}
         )
 
         query_response = await self.request_router.route_kb_query(query_request)
 
-        # Step 6: Verify error response
-        print("\n[Step 6] Verifying error response...")
+        # Step 5: Verify error response
+        logger.debug("[Step 5] Verifying error response...")
         assert query_response.status in ["error", "denied"], f"Expected error or denied status, got {query_response.status}"
         assert query_response.error is not None or query_response.status == "denied"
-        print(f"✓ Error/Denied status returned: {query_response.status}")
+        logger.debug("✓ Error/Denied status returned: %s", query_response.status)
         if query_response.error:
-            print(f"✓ Error message: {query_response.error}")
+            logger.debug("✓ Error message: %s", query_response.error)
 
-        # Step 7: Verify no data leaked
-        print("\n[Step 7] Verifying no data leaked...")
+        # Step 6: Verify no data leaked
+        logger.debug("[Step 6] Verifying no data leaked...")
         assert query_response.data is None, "No data should be returned for offline KB"
-        print("✓ No partial data leaked")
-
-        # Step 8: Verify audit log records failure
-        print("\n[Step 8] Verifying audit log records failure...")
-        await asyncio.sleep(0.5)
+        logger.debug("✓ No partial data leaked")
 
-        audit_query = AuditQuery(
+        # Step 7: Verify audit log records failure
+        logger.debug("[Step 7] Verifying audit log records failure...")
+        # Wait for buffered audit events to be written
+        await self.audit_buffer.flush()
+        audit_events = await self.persistence.query_audit_logs_prepared(
             event_type=AuditEventType.QUERY,
-            source_id="marketing-agent-1",
-            target_id="offline-kb-1",
+            source_id=MARKETING_AGENT_ID,
+            target_id=OFFLINE_KB_ID,
             limit=5,
         )
-        audit_events = await self.persistence.query_audit_logs(audit_query)
         
         if len(audit_events) > 0:
             latest_event = audit_events[0]
-            print(f"✓ Audit log created:")
-            print(f"  - Event type: {latest_event.event_type}")
-            print(f"  - Outcome: {latest_event.outcome}")
-            print(f"  - Error: {latest_event.request_metadata.get('error', 'N/A')}")
+            logger.debug("✓ Audit log created:")
+            logger.debug("  - Event type: %s", latest_event.event_type)
+            logger.debug("  - Outcome: %s", latest_event.outcome)
+            logger.debug("  - Error: %s", latest_event.request_metadata.get('error', 'N/A'))
             
             # Verify failure outcome (can be ERROR or DENIED)
             assert latest_event.outcome in [AuditOutcome.ERROR, AuditOutcome.DENIED]
-            print(f"✓ Audit log records failure outcome: {latest_event.outcome}")
+            logger.debug("✓ Audit log records failure outcome: %s", latest_event.outcome)
         else:
-            print("⚠ No audit events found (may be OK if enforcement failed before logging)")
+            logger.debug("⚠ No audit events found (may be OK if enforcement failed before logging)")
 
-        print("\n✅ SCENARIO 5.2 PASSED: KB unavailable error handled correctly")
+        logger.debug("✅ SCENARIO 5.2 PASSED: KB unavailable error handled correctly")
 
     async def test_scenario_5_1b_query_without_masking(self):
         """
@@ -476,108 +633,58 @@ allow if {
 
         Tests that queries work correctly when no masking policy exists.
         """
-        print("\n" + "=" * 70)
-        print("TEST SCENARIO 5.1B: Agent Queries KB without Masking")
-        print("=" * 70)
-
-        # Step 1: Register Sales Agent (different from marketing)
-        print("\n[Step 1] Registering Sales Agent...")
-        agent_request = AgentRegistrationRequest(
-            identity="sales-agent-1",
-            version="1.0.0",
-            capabilities=["query_kb", "write_kb"],
-            operations=["query", "execute"],
-            health_endpoint="http://localhost:8002/health",
-            metadata={"team": "sales", "region": "global"},
+        logger.debug("TEST SCENARIO 5.1B: Agent Queries KB without Masking")
+
+        # Steps 1-3: Sales Agent (different from marketing), Sales KB and the
+        # policy without masking are in place
+        logger.debug("[Steps 1-3] Checking agent, KB and policy...")
+        agent_response, kb_response, policy_loaded = await asyncio.gather(
+            self._ensure_agent(SALES_AGENT_ID),
+            self._ensure_kb(SALES_KB_ID),
+            self._policy_loaded(NO_MASKING_POLICY),
         )
-        agent_response = await self.agent_service.register_agent(agent_request)
-        assert agent_response.identity == "sales-agent-1"
-        print(f"✓ Sales agent registered: {agent_response.identity}")
-
-        # Step 2: Register Sales KB
-        print("\n[Step 2] Registering Sales KB...")
-        kb_request = KBRegistrationRequest(
-            kb_id="sales-kb-1",
-            kb_type="postgres",
-            endpoint="postgresql://localhost:5432/agentmesh",
-            operations=["sql_query"],
-            kb_schema={
-                "tables": {
-                    "deals": {
-                        "columns": ["id", "region", "revenue", "customer_email", "customer_phone"]
-                    }
-                }
-            },
-            metadata={"owner": "sales"},
-        )
-        kb_response = await self.kb_service.register_kb(kb_request)
-        assert kb_response.kb_id == "sales-kb-1"
-        print(f"✓ Sales KB registered: {kb_response.kb_id}")
-
-        # Step 3: Create policy without masking
-        print("\n[Step 3] Creating policy without masking...")
-        
-        # Clean up any existing policies first
-        await self.opa_client.delete_policy("field_masking_test", delete_file=False)
-        await self.opa_client.delete_policy("offline_kb_policy", delete_file=False)
-        await self.opa_client.delete_policy("no_masking_policy", delete_file=False)
-        await asyncio.sleep(0.2)
-        
-        policy_rego = """
-package agentmesh
-
-default allow = false
-
-allow if {
-    input.principal == "sales-agent-1"
-    input.resource == "sales-kb-1"
-    input.action == "query"
-}
-"""
-        policy_result = await self.opa_client.upload_policy(
-            "no_masking_policy", policy_rego, persist=False
-        )
-        assert policy_result["success"]
-        print("✓ Policy created (no masking rules)")
-
-        await asyncio.sleep(0.5)
+        assert agent_response.identity == SALES_AGENT_ID
+        assert kb_response.kb_id == SALES_KB_ID
+        assert policy_loaded
+        logger.debug("✓ Sales agent registered: %s", agent_response.identity)
+        logger.debug("✓ Sales KB registered: %s", kb_response.kb_id)
+        logger.debug("✓ Policy loaded (no masking rules)")
 
         # Step 4: Query KB
-        print("\n[Step 4] Querying KB...")
+        logger.debug("[Step 4] Querying KB...")
         query_request = KBQueryRequest(
-            requester_id="sales-agent-1",
-            kb_id="sales-kb-1",
+            requester_id=SALES_AGENT_ID,
+            kb_id=SALES_KB_ID,
             operation="sql_query",
             params={
-                "query": "SELECT region, revenue, customer_email FROM deals WHERE region='EMEA'"
+                "query": f"SELECT region, revenue, customer_email FROM {DEALS_TABLE} WHERE region='EMEA'"
             }
         )
 
         query_response = await self.request_router.route_kb_query(query_request)
 
         # Step 5: Verify response
-        print("\n[Step 5] Verifying response...")
+        logger.debug("[Step 5] Verifying response...")
         assert query_response.status == "success"
         assert query_response.data is not None
         
         # Check if data is nested in rows
         rows = query_response.data.get("rows", query_response.data) if isinstance(query_response.data, dict) else query_response.data
-        print(f"✓ Query successful, returned {len(rows)} rows")
+        logger.debug("✓ Query successful, returned %d rows", len(rows))
 
         # Step 6: Verify NO masking was applied to query result fields
-        print("\n[Step 6] Verifying no masking...")
+        logger.debug("[Step 6] Verifying no masking...")
         # Note: masked_fields may include default fields from global policy (ssn, credit_card)
         # but fields in the actual query result should not be masked
-        print(f"✓ Masked fields list: {query_response.masked_fields}")
+        logger.debug("✓ Masked fields list: %s", query_response.masked_fields)
 
         # Verify data contains actual values
-        for row in rows:
-            if "customer_email" in row:
-                assert row["customer_email"] not in ["***", "[REDACTED]"], "customer_email should not be masked"
-                assert "@example.com" in row["customer_email"]
-        print("✓ Data returned unmasked")
+        emails = _column(rows, "customer_email")
+        assert not set(emails) & {"***", "[REDACTED]"}, "customer_email should not be masked"
+        assert all(email.endswith("@example.com") for email in emails)
+        logger.debug("✓ Data returned unmasked")
 
-        print("\n✅ SCENARIO 5.1B PASSED: Query without masking works correctly")
+        logger.debug("✅ SCENARIO 5.1B PASSED: Query without masking works correctly")
 
 
 if __name__ == "__main__":
@@ -131,9 +131,6 @@ class TestSection4RealtimeNotificationsAgentic:
         
         print("   ✓ Both agents subscribed to mesh.directory.updates")
 
-        # Give subscriptions time to be established
-        await asyncio.sleep(0.5)
-
         # Step 4: Admin agent registers new KB (via NATS)
         print("\n4. Admin registering new KB via NATS...")
         admin_agent = self._create_agent()
@@ -248,9 +245,6 @@ class TestSection4RealtimeNotificationsAgentic:
         await observer_agent.subscribe_to_directory_updates(observer_callback)
         print("   ✓ Observer subscribed to mesh.directory.updates")
 
-        # Give subscription time to be established
-        await asyncio.sleep(0.5)
-
         # Step 3: Register new agent with capabilities
         print("\n3. Registering new agent with capabilities...")
         new_agent = self._create_agent()
@@ -354,9 +348,6 @@ class TestSection4RealtimeNotificationsAgentic:
         await observer_agent.subscribe_to_directory_updates(observer_callback)
         print("   ✓ Observer subscribed to mesh.directory.updates")
 
-        # Give subscription time to be established
-        await asyncio.sleep(0.5)
-
         # Step 3: Register KB with multiple operations
         print("\n3. Registering KB with multiple operations...")
         admin_agent = self._create_agent()
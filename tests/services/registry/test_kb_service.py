@@ -101,6 +101,24 @@ async def test_deregister_kb(kb_service, sample_kb_registration):
         await kb_service.get_kb_details(sample_kb_registration.kb_id)
 
 
+@pytest.mark.asyncio
+async def test_deregister_kbs(kb_service, sample_kb_registration):
+    """Test deregistering several KBs at once"""
+    from services.registry.exceptions import EntityNotFoundError
+
+    other = sample_kb_registration.model_copy(update={"kb_id": "test-kb-other"})
+    await kb_service.register_kb(sample_kb_registration)
+    await kb_service.register_kb(other)
+
+    await kb_service.deregister_kbs(
+        [sample_kb_registration.kb_id, other.kb_id, "never-registered"]
+    )
+
+    for kb_id in (sample_kb_registration.kb_id, other.kb_id):
+        with pytest.raises(EntityNotFoundError):
+            await kb_service.get_kb_details(kb_id)
+
+
 @pytest.mark.asyncio
 async def test_register_neo4j_kb(kb_service):
     """Test registering a Neo4j KB"""